@@ -22,6 +22,10 @@ class BaseCollector(ABC):
         version: Collector version (semantic versioning)
         config: Configuration dictionary
 
+    ``name`` and ``version`` may be declared as plain ``ClassVar[str]``
+    attributes instead of properties; the plugin manager then registers
+    the collector without instantiating it.
+
     Example:
         >>> class MyCollector(BaseCollector):
         ...     def collect(self) -> Dict[str, Any]:
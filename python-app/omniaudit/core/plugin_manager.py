@@ -5,16 +5,20 @@ Manages the lifecycle of all plugins (collectors, analyzers, reporters).
 Handles loading, validation, execution, and unloading.
 """
 
-from typing import Dict, Any, List, Optional, Type
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Type
 from pathlib import Path
 import importlib
 import inspect
-from datetime import datetime
+from time import perf_counter
 
 from .exceptions import PluginError, PluginLoadError, PluginExecutionError
-from ..collectors.base import BaseCollector
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    # Resolved lazily in register_plugin so CLI paths that never run a
+    # plugin don't pay for importing the collectors package.
+    from ..collectors.base import BaseCollector
+
 logger = get_logger(__name__)
 
 
@@ -37,11 +41,13 @@ class PluginManager:
 
     def __init__(self):
         """Initialize the plugin manager."""
-        self._plugins: Dict[str, Type[BaseCollector]] = {}
-        self._loaded_instances: Dict[str, BaseCollector] = {}
+        self._plugins: Dict[str, "Type[BaseCollector]"] = {}
+        self._loaded_instances: Dict[str, "BaseCollector"] = {}
+        self._base_cls: Optional["Type[BaseCollector]"] = None
+        self._meta: Dict[str, Dict[str, str]] = {}
         logger.info("PluginManager initialized")
 
-    def register_plugin(self, plugin_class: Type[BaseCollector]) -> None:
+    def register_plugin(self, plugin_class: "Type[BaseCollector]") -> None:
         """
         Register a plugin class.
 
@@ -55,26 +61,44 @@ class PluginManager:
         if not inspect.isclass(plugin_class):
             raise PluginError(f"Plugin must be a class: {plugin_class}")
 
-        if not issubclass(plugin_class, BaseCollector):
+        if self._base_cls is None:
+            from ..collectors.base import BaseCollector
+            self._base_cls = BaseCollector
+
+        if not issubclass(plugin_class, self._base_cls):
             raise PluginError(
                 f"Plugin must inherit from BaseCollector: {plugin_class.__name__}"
             )
 
-        # Try to get plugin name without full instantiation
-        # Use class name as fallback if instantiation fails
-        plugin_name = plugin_class.__name__.lower().replace("collector", "_collector")
+        # Collectors that declare name/version as plain class attributes
+        # can be registered without being instantiated
+        name_attr = getattr(plugin_class, "name", None)
+        version_attr = getattr(plugin_class, "version", None)
 
-        try:
-            # Try to create instance to get proper name
-            temp_instance = plugin_class({})
-            plugin_name = temp_instance.name
-            version = temp_instance.version
-        except Exception:
-            # If instantiation fails, we'll get name/version later
-            version = "unknown"
-
-        # Register
+        if isinstance(name_attr, str) and isinstance(version_attr, str):
+            plugin_name = name_attr
+            version = version_attr
+        else:
+            # Try to get plugin name without full instantiation
+            # Use class name as fallback if instantiation fails
+            plugin_name = plugin_class.__name__.lower().replace("collector", "_collector")
+
+            try:
+                # Try to create instance to get proper name
+                temp_instance = plugin_class({})
+                plugin_name = temp_instance.name
+                version = temp_instance.version
+            except Exception:
+                # If instantiation fails, we'll get name/version later
+                version = "unknown"
+
+        # Register and cache metadata so list_plugins never re-instantiates
         self._plugins[plugin_name] = plugin_class
+        self._meta[plugin_name] = {
+            "name": plugin_name,
+            "version": version,
+            "class": plugin_class.__name__
+        }
         logger.info(f"Registered plugin: {plugin_name} v{version}")
 
     def load_plugin(self, plugin_name: str, config: Dict[str, Any]) -> None:
@@ -130,11 +154,11 @@ class PluginManager:
 
         try:
             logger.info(f"Executing plugin: {plugin_name}")
-            start_time = datetime.now()
+            start_time = perf_counter()
 
             result = instance.collect()
 
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = perf_counter() - start_time
             logger.info(
                 f"Plugin executed successfully: {plugin_name} "
                 f"({execution_time:.2f}s)"
@@ -164,23 +188,7 @@ class PluginManager:
         Returns:
             List of plugin metadata dictionaries
         """
-        plugins = []
-        for name, plugin_class in self._plugins.items():
-            try:
-                temp = plugin_class({})
-                plugins.append({
-                    "name": name,
-                    "version": temp.version,
-                    "class": plugin_class.__name__
-                })
-            except Exception:
-                # Skip plugins that can't be instantiated with empty config
-                plugins.append({
-                    "name": name,
-                    "version": "unknown",
-                    "class": plugin_class.__name__
-                })
-        return plugins
+        return [dict(meta) for meta in self._meta.values()]
 
     def is_loaded(self, plugin_name: str) -> bool:
         """Check if a plugin is loaded."""
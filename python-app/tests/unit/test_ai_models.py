@@ -7,8 +7,9 @@ feature models used with Anthropic Structured Outputs.
 
 import pytest
 from datetime import datetime
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
+from omniaudit.models import ai_models
 from omniaudit.models.ai_models import (
     AIAnalysisError,
     AIAnalysisMetadata,
@@ -540,3 +541,17 @@ class TestModelDumps:
         data = result.model_dump()
         assert "technical_debt_score" in data
         assert data["code_smells"] == []
+
+
+class TestModelBuild:
+    """Test that model schemas are built at import."""
+
+    def test_models_complete_at_import(self):
+        """No model should defer its validator build to the first request."""
+        models = [
+            obj for obj in vars(ai_models).values()
+            if isinstance(obj, type) and issubclass(obj, BaseModel) and obj is not BaseModel
+        ]
+        assert models
+        incomplete = [model.__name__ for model in models if not model.__pydantic_complete__]
+        assert incomplete == []
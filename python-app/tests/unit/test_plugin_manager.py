@@ -85,3 +85,28 @@ def test_unload_plugin(tmp_path):
 
     manager.unload_plugin("git_collector")
     assert not manager.is_loaded("git_collector")
+
+
+def test_register_plugin_uses_class_attributes():
+    """Test registration reads class-level name/version without instantiating."""
+    from omniaudit.collectors.base import BaseCollector
+
+    class StaticCollector(BaseCollector):
+        name = "static_collector"
+        version = "2.0.0"
+
+        def __init__(self, config=None):
+            raise AssertionError("should not be instantiated")
+
+        def _validate_config(self):
+            pass
+
+        def collect(self):
+            return {}
+
+    manager = PluginManager()
+    manager.register_plugin(StaticCollector)
+
+    assert manager.list_plugins() == [
+        {"name": "static_collector", "version": "2.0.0", "class": "StaticCollector"}
+    ]
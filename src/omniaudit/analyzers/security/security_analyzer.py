@@ -7,6 +7,7 @@ and vulnerability identification.
 
 import logging
 import uuid
+from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime
@@ -218,40 +219,21 @@ class SecurityAnalyzer(BaseAnalyzer):
 
     def _create_summary(self, findings: List[SecurityFinding]) -> Dict[str, Any]:
         """Create summary statistics from findings."""
-        summary = {
-            "total_findings": len(findings),
-            "by_severity": {
-                "critical": 0,
-                "high": 0,
-                "medium": 0,
-                "low": 0,
-                "info": 0,
-            },
-            "by_category": {},
-            "top_issues": [],
-            "files_with_issues": len(set(f.file_path for f in findings)),
-        }
-
-        # Count by severity
-        for finding in findings:
-            summary["by_severity"][finding.severity.value] += 1
-
-        # Count by category
-        for finding in findings:
-            category = finding.category.value
-            summary["by_category"][category] = summary["by_category"].get(category, 0) + 1
+        # Count by severity, reporting every level in severity order
+        severity_counts = Counter(finding.severity for finding in findings)
 
         # Get top issues (most common)
-        issue_counts = {}
-        for finding in findings:
-            issue_counts[finding.title] = issue_counts.get(finding.title, 0) + 1
+        issue_counts = Counter(finding.title for finding in findings)
 
-        top_issues = sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        summary["top_issues"] = [
-            {"issue": issue, "count": count} for issue, count in top_issues
-        ]
-
-        return summary
+        return {
+            "total_findings": len(findings),
+            "by_severity": {severity.value: severity_counts[severity] for severity in Severity},
+            "by_category": dict(Counter(finding.category.value for finding in findings)),
+            "top_issues": [
+                {"issue": issue, "count": count} for issue, count in issue_counts.most_common(10)
+            ],
+            "files_with_issues": len(set(f.file_path for f in findings)),
+        }
 
     def _calculate_risk_score(self, report: SecurityReport) -> float:
         """
@@ -2,6 +2,7 @@
 Type definitions for security analyzer.
 """
 
+from collections import Counter
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
@@ -84,18 +85,12 @@ class SecurityReport(BaseModel):
 
     def get_severity_counts(self) -> Dict[str, int]:
         """Get count of findings by severity."""
-        counts = {severity.value: 0 for severity in Severity}
-        for finding in self.findings:
-            counts[finding.severity.value] += 1
-        return counts
+        counts = Counter(finding.severity for finding in self.findings)
+        return {severity.value: counts[severity] for severity in Severity}
 
     def get_category_counts(self) -> Dict[str, int]:
         """Get count of findings by category."""
-        counts = {}
-        for finding in self.findings:
-            category = finding.category.value
-            counts[category] = counts.get(category, 0) + 1
-        return counts
+        return dict(Counter(finding.category.value for finding in self.findings))
 
     def get_critical_findings(self) -> List[SecurityFinding]:
         """Get all critical severity findings."""
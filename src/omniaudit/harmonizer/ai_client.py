@@ -0,0 +1,117 @@
+"""
+Shared Anthropic clients for the Harmonization Engine.
+
+Synchronous clients are created once per API key and reused by every stage.
+Async clients are opened for the duration of an ``async_anthropic_client``
+block and closed when it exits; nested blocks for the same key reuse the
+enclosing client, so the AI stages of a harmonization run share one
+connection pool. Synchronous entry points drive the async stages with
+``run_coroutine``.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, AsyncIterator, Coroutine, Optional, Tuple, TypeVar
+
+# Try to import Anthropic SDK
+try:
+    from anthropic import Anthropic, AsyncAnthropic
+
+    ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ANTHROPIC_AVAILABLE = False
+
+# Prefer uvloop's faster event loop for driving concurrent AI requests
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
+
+# (API key, client) opened by the innermost async_anthropic_client block.
+# Tasks started inside the block inherit it with the rest of their context.
+_async_client: ContextVar[Optional[Tuple[str, "AsyncAnthropic"]]] = ContextVar(
+    "_async_client", default=None
+)
+
+
+@lru_cache(maxsize=4)
+def get_anthropic_client(api_key: str) -> "Anthropic":
+    """
+    Get the shared synchronous client for an API key.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        Anthropic client
+    """
+    return Anthropic(api_key=api_key)
+
+
+@asynccontextmanager
+async def async_anthropic_client(
+    api_key: Optional[str],
+) -> AsyncIterator[Optional["AsyncAnthropic"]]:
+    """
+    Open an async client for an API key, closing it when the block exits.
+
+    Inside an enclosing block for the same key, the enclosing client is
+    reused and left open.
+
+    Args:
+        api_key: Anthropic API key, or None when AI is not configured
+
+    Yields:
+        AsyncAnthropic client, or None without an API key or the SDK
+    """
+    current = _async_client.get()
+    if current is not None and current[0] == api_key:
+        yield current[1]
+    elif not (ANTHROPIC_AVAILABLE and api_key):
+        yield None
+    else:
+        async with AsyncAnthropic(api_key=api_key) as client:
+            token = _async_client.set((api_key, client))
+            try:
+                yield client
+            finally:
+                _async_client.reset(token)
+
+
+def get_async_anthropic_client(api_key: Optional[str]) -> "AsyncAnthropic":
+    """
+    Get the async client opened by the enclosing async_anthropic_client block.
+
+    Args:
+        api_key: Anthropic API key
+
+    Returns:
+        AsyncAnthropic client
+
+    Raises:
+        RuntimeError: If no block has opened a client for the key
+    """
+    current = _async_client.get()
+    if current is None or current[0] != api_key:
+        raise RuntimeError("No async Anthropic client is open for this API key")
+    return current[1]
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on a new event loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    result: T = uvloop.run(coro) if UVLOOP_AVAILABLE else asyncio.run(coro)
+    return result
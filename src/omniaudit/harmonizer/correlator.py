@@ -5,12 +5,47 @@ This module identifies correlations between findings across different files,
 helping to understand systemic issues and related problems.
 """
 
+import heapq
 import os
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
 from typing import Dict, List, Set, Tuple
 
 from omniaudit.harmonizer.types import CorrelationConfig, Finding
 
+# Below this size, pickling the indexes to worker processes costs more
+# than correlating serially
+PARALLEL_MIN_FINDINGS = 2000
+
+
+@lru_cache(maxsize=8192)
+def _split_rule(rule_id: str) -> Tuple[str, ...]:
+    """Split a rule ID into segments on common separators."""
+    return tuple(rule_id.replace("-", "/").replace("_", "/").split("/"))
+
+
+@lru_cache(maxsize=8192)
+def _rule_similarity(rule1: str, rule2: str) -> float:
+    """Fraction of positionally matching segments between two rule IDs."""
+    # Simple prefix matching
+    # E.g., "S001" and "S002" have high similarity
+    # "security/S001" and "security/S002" have high similarity
+
+    # Split on common separators
+    parts1 = _split_rule(rule1)
+    parts2 = _split_rule(rule2)
+
+    # Count matching parts
+    max_len = max(len(parts1), len(parts2))
+    if max_len == 0:
+        return 0.0
+
+    matching = sum(1 for p1, p2 in zip(parts1, parts2) if p1 == p2)
+    return matching / max_len
+
 
 class Correlator:
     """
@@ -26,6 +61,9 @@ class Correlator:
     def __init__(self, config: CorrelationConfig):
         """Initialize correlator with configuration."""
         self.config = config
+        # Path handling is repeated per finding and per depth; memoize by file
+        self._dir_key_cache: Dict[Tuple[str, int], str] = {}
+        self._path_parts_cache: Dict[str, List[str]] = {}
 
     def correlate(self, findings: List[Finding]) -> Dict[str, List[str]]:
         """
@@ -40,62 +78,132 @@ class Correlator:
         if not self.config.enabled or len(findings) < 2:
             return {}
 
-        correlations: Dict[str, Set[str]] = defaultdict(set)
-
         # Build indexes for efficient lookup
-        by_category = self._index_by_category(findings)
-        by_directory = self._index_by_directory(findings)
-        by_rule = self._index_by_rule(findings)
+        by_category, by_directory, by_rule = self._build_indexes(findings)
+        similar_rules = self._index_similar_rules(by_rule)
+        finding_map = {f.id: f for f in findings}
+        indexes = (by_category, by_directory, by_rule, similar_rules, finding_map)
+
+        workers = self.config.max_workers
+        if workers <= 1 or len(findings) < PARALLEL_MIN_FINDINGS:
+            return self._correlate_chunk(findings, indexes)
+
+        # Per-finding work is independent once the indexes exist, so fan it
+        # out over processes (the work is CPU-bound and holds the GIL)
+        chunk_size = -(-len(findings) // workers)
+        chunks = [findings[i : i + chunk_size] for i in range(0, len(findings), chunk_size)]
+
+        correlations: Dict[str, List[str]] = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(self._correlate_chunk, chunks, repeat(indexes)):
+                correlations.update(partial)
+
+        return correlations
+
+    def _correlate_chunk(
+        self, findings: List[Finding], indexes: Tuple
+    ) -> Dict[str, List[str]]:
+        """
+        Correlate a slice of findings against the full-batch indexes.
 
-        # Find correlations
+        Args:
+            findings: Findings to correlate
+            indexes: (by_category, by_directory, by_rule, similar_rules, finding_map)
+
+        Returns:
+            Dict mapping finding IDs to lists of correlated finding IDs
+        """
+        by_category, by_directory, by_rule, similar_rules, finding_map = indexes
+        correlations: Dict[str, List[str]] = {}
+
+        # Find correlations, accumulating every source into a single set
         for finding in findings:
-            correlated = set()
+            correlated: Set[str] = set()
 
             # Correlate by file proximity
             if self.config.file_proximity_threshold > 0:
-                correlated.update(self._find_proximity_correlations(finding, by_directory))
+                self._add_proximity_correlations(finding, by_directory, correlated)
 
             # Correlate by rule similarity
-            correlated.update(self._find_rule_correlations(finding, by_rule))
+            self._add_rule_correlations(finding, by_rule, similar_rules, correlated)
 
             # Correlate by category
-            correlated.update(self._find_category_correlations(finding, by_category))
+            self._add_category_correlations(finding, by_category, correlated)
 
             # Remove self and limit
             correlated.discard(finding.id)
             if len(correlated) > self.config.max_correlated_findings:
                 # Keep only the most relevant (by same rule > same directory > same category)
-                correlated = self._prioritize_correlations(
-                    finding, correlated, findings, by_rule, by_directory
-                )
+                correlated = self._prioritize_correlations(finding, correlated, finding_map)
 
-            correlations[finding.id] = correlated
+            correlations[finding.id] = list(correlated)
 
-        # Convert sets to lists
-        return {k: list(v) for k, v in correlations.items()}
+        return correlations
 
-    def _index_by_category(self, findings: List[Finding]) -> Dict[str, List[Finding]]:
-        """Index findings by category."""
-        index: Dict[str, List[Finding]] = defaultdict(list)
-        for finding in findings:
-            index[finding.category].append(finding)
-        return index
+    def _build_indexes(
+        self, findings: List[Finding]
+    ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], Dict[str, List[str]]]:
+        """
+        Index finding IDs by category, directory and rule ID in a single pass.
 
-    def _index_by_directory(self, findings: List[Finding]) -> Dict[str, List[Finding]]:
-        """Index findings by directory."""
-        index: Dict[str, List[Finding]] = defaultdict(list)
-        for finding in findings:
-            directory = self._get_directory_key(finding.file_path, self.config.file_proximity_threshold)
-            index[directory].append(finding)
-        return index
+        The indexes hold IDs rather than Finding objects so correlation can
+        extend result sets straight from the index lists.
+
+        Returns:
+            Tuple of (by_category, by_directory, by_rule)
+        """
+        by_category: Dict[str, List[str]] = defaultdict(list)
+        by_directory: Dict[str, List[str]] = defaultdict(list)
+        by_rule: Dict[str, List[str]] = defaultdict(list)
+        depth = self.config.file_proximity_threshold
 
-    def _index_by_rule(self, findings: List[Finding]) -> Dict[str, List[Finding]]:
-        """Index findings by rule ID."""
-        index: Dict[str, List[Finding]] = defaultdict(list)
         for finding in findings:
+            finding_id = finding.id
+            by_category[finding.category].append(finding_id)
+            by_directory[self._get_directory_key(finding.file_path, depth)].append(finding_id)
             if finding.rule_id:
-                index[finding.rule_id].append(finding)
-        return index
+                by_rule[finding.rule_id].append(finding_id)
+
+        return by_category, by_directory, by_rule
+
+    def _index_similar_rules(
+        self, by_rule: Dict[str, List[str]]
+    ) -> Dict[str, List[str]]:
+        """
+        Map each rule ID to the other rule IDs that meet the similarity threshold.
+
+        Rule similarity counts positionally matching rule-ID segments, so only
+        rules sharing at least one (position, segment) pair can score above
+        zero. Indexing segments by position limits the similarity checks to
+        those candidates instead of every pair of rules.
+        """
+        threshold = self.config.rule_similarity_threshold
+        if threshold >= 1.0:
+            return {}
+
+        if threshold <= 0.0:
+            # Every rule pair trivially meets a zero threshold
+            return {rule_id: [r for r in by_rule if r != rule_id] for rule_id in by_rule}
+
+        by_segment: Dict[Tuple[int, str], List[str]] = defaultdict(list)
+        for rule_id in by_rule:
+            for position, segment in enumerate(_split_rule(rule_id)):
+                by_segment[(position, segment)].append(rule_id)
+
+        similar: Dict[str, List[str]] = {}
+        for rule_id in by_rule:
+            candidates: Set[str] = set()
+            for position, segment in enumerate(_split_rule(rule_id)):
+                candidates.update(by_segment[(position, segment)])
+            candidates.discard(rule_id)
+
+            similar[rule_id] = [
+                other
+                for other in candidates
+                if self._compute_rule_similarity(rule_id, other) >= threshold
+            ]
+
+        return similar
 
     def _get_directory_key(self, file_path: str, depth: int) -> str:
         """
@@ -108,84 +216,80 @@ class Correlator:
         Returns:
             Directory key string
         """
+        cache_key = (file_path, depth)
+        key = self._dir_key_cache.get(cache_key)
+        if key is not None:
+            return key
+
         # Normalize path
-        path = os.path.normpath(file_path)
-        parts = path.split(os.sep)
+        parts = self._path_parts_cache.get(file_path)
+        if parts is None:
+            parts = os.path.normpath(file_path).split(os.sep)
+            self._path_parts_cache[file_path] = parts
 
         # Get directory path (exclude file name)
         if len(parts) > 1:
             dir_parts = parts[:-1]
         else:
-            return "root"
+            key = "root"
+            self._dir_key_cache[cache_key] = key
+            return key
 
         # Limit depth
         if depth == 0:
             # Exact directory
-            return os.sep.join(dir_parts)
+            key = os.sep.join(dir_parts)
         elif depth > 0 and len(dir_parts) > depth:
             # Parent directory at specified depth
-            return os.sep.join(dir_parts[:-depth])
+            key = os.sep.join(dir_parts[:-depth])
         else:
             # Root or shallow path
-            return os.sep.join(dir_parts[:1]) if dir_parts else "root"
+            key = os.sep.join(dir_parts[:1]) if dir_parts else "root"
 
-    def _find_proximity_correlations(
-        self, finding: Finding, by_directory: Dict[str, List[Finding]]
-    ) -> Set[str]:
-        """Find findings in the same or nearby directories."""
-        correlated = set()
+        self._dir_key_cache[cache_key] = key
+        return key
 
+    def _add_proximity_correlations(
+        self,
+        finding: Finding,
+        by_directory: Dict[str, List[str]],
+        correlated: Set[str],
+    ) -> None:
+        """Add findings in the same or nearby directories to ``correlated``."""
         # Check at different depth levels
         for depth in range(self.config.file_proximity_threshold + 1):
             dir_key = self._get_directory_key(finding.file_path, depth)
             if dir_key in by_directory:
-                for other in by_directory[dir_key]:
-                    if other.id != finding.id:
-                        correlated.add(other.id)
-
-        return correlated
-
-    def _find_rule_correlations(
-        self, finding: Finding, by_rule: Dict[str, List[Finding]]
-    ) -> Set[str]:
-        """Find findings with the same or similar rule IDs."""
-        correlated = set()
+                correlated.update(by_directory[dir_key])
 
+    def _add_rule_correlations(
+        self,
+        finding: Finding,
+        by_rule: Dict[str, List[str]],
+        similar_rules: Dict[str, List[str]],
+        correlated: Set[str],
+    ) -> None:
+        """Add findings with the same or similar rule IDs to ``correlated``."""
         if not finding.rule_id:
-            return correlated
+            return
 
         # Exact rule match
         if finding.rule_id in by_rule:
-            for other in by_rule[finding.rule_id]:
-                if other.id != finding.id:
-                    correlated.add(other.id)
+            correlated.update(by_rule[finding.rule_id])
 
         # Similar rule IDs (e.g., same prefix)
-        if self.config.rule_similarity_threshold < 1.0:
-            for rule_id, findings in by_rule.items():
-                if rule_id == finding.rule_id:
-                    continue
-
-                similarity = self._compute_rule_similarity(finding.rule_id, rule_id)
-                if similarity >= self.config.rule_similarity_threshold:
-                    for other in findings:
-                        if other.id != finding.id:
-                            correlated.add(other.id)
-
-        return correlated
-
-    def _find_category_correlations(
-        self, finding: Finding, by_category: Dict[str, List[Finding]]
-    ) -> Set[str]:
-        """Find findings in the same category."""
-        correlated = set()
+        for rule_id in similar_rules.get(finding.rule_id, ()):
+            correlated.update(by_rule[rule_id])
 
+    def _add_category_correlations(
+        self,
+        finding: Finding,
+        by_category: Dict[str, List[str]],
+        correlated: Set[str],
+    ) -> None:
+        """Add findings in the same category to ``correlated``."""
         if finding.category in by_category:
-            for other in by_category[finding.category]:
-                if other.id != finding.id:
-                    correlated.add(other.id)
-
-        return correlated
+            correlated.update(by_category[finding.category])
 
     def _compute_rule_similarity(self, rule1: str, rule2: str) -> float:
         """
@@ -198,29 +302,16 @@ class Correlator:
         Returns:
             Similarity score (0.0 to 1.0)
         """
-        # Simple prefix matching
-        # E.g., "S001" and "S002" have high similarity
-        # "security/S001" and "security/S002" have high similarity
-
-        # Split on common separators
-        parts1 = rule1.replace("-", "/").replace("_", "/").split("/")
-        parts2 = rule2.replace("-", "/").replace("_", "/").split("/")
-
-        # Count matching parts
-        max_len = max(len(parts1), len(parts2))
-        if max_len == 0:
-            return 0.0
-
-        matching = sum(1 for p1, p2 in zip(parts1, parts2) if p1 == p2)
-        return matching / max_len
+        # Similarity is symmetric, so order the pair to share cache entries
+        if rule2 < rule1:
+            rule1, rule2 = rule2, rule1
+        return _rule_similarity(rule1, rule2)
 
     def _prioritize_correlations(
         self,
         finding: Finding,
         correlated_ids: Set[str],
-        all_findings: List[Finding],
-        by_rule: Dict[str, List[Finding]],
-        by_directory: Dict[str, List[Finding]],
+        finding_map: Dict[str, Finding],
     ) -> Set[str]:
         """
         Prioritize correlations when there are too many.
@@ -234,15 +325,12 @@ class Correlator:
         Args:
             finding: The finding to correlate
             correlated_ids: Set of correlated finding IDs
-            all_findings: All findings
-            by_rule: Rule index
-            by_directory: Directory index
+            finding_map: Finding ID -> Finding lookup for all findings
 
         Returns:
             Prioritized set of correlation IDs (limited to max)
         """
-        # Create finding ID -> Finding map
-        finding_map = {f.id: f for f in all_findings}
+        finding_dir = finding.directory
 
         # Score each correlation
         scored: List[Tuple[str, float]] = []
@@ -258,7 +346,7 @@ class Correlator:
                 score += 10.0
 
             # Same exact directory: +5
-            if os.path.dirname(finding.file_path) == os.path.dirname(correlated_finding.file_path):
+            if finding_dir == correlated_finding.directory:
                 score += 5.0
 
             # Same file: +3
@@ -277,11 +365,8 @@ class Correlator:
 
             scored.append((corr_id, score))
 
-        # Sort by score descending
-        scored.sort(key=lambda x: x[1], reverse=True)
-
-        # Take top N
-        top_n = scored[: self.config.max_correlated_findings]
+        # Take top N by score without sorting the full list
+        top_n = heapq.nlargest(self.config.max_correlated_findings, scored, key=itemgetter(1))
         return {corr_id for corr_id, _ in top_n}
 
     def get_correlation_graph(
@@ -296,19 +381,20 @@ class Correlator:
         Returns:
             Graph structure with nodes and edges
         """
-        nodes = set(correlations.keys())
-        for corr_list in correlations.values():
-            nodes.update(corr_list)
+        # Sets make the reciprocal-edge membership checks O(1)
+        neighbours = {source: set(targets) for source, targets in correlations.items()}
 
-        edges = []
-        for source, targets in correlations.items():
+        nodes = set(neighbours)
+        edge_set: Set[Tuple[str, str]] = set()
+        for source, targets in neighbours.items():
+            nodes.update(targets)
             for target in targets:
                 # Only add edge if it's bidirectional (stronger correlation)
-                if source in correlations.get(target, []):
+                if source in neighbours.get(target, ()):
                     # Avoid duplicates by ordering
-                    edge = tuple(sorted([source, target]))
-                    if edge not in edges:
-                        edges.append(edge)
+                    edge_set.add((source, target) if source < target else (target, source))
+
+        edges = sorted(edge_set)
 
         return {
             "nodes": list(nodes),
@@ -7,11 +7,47 @@ semantic similarity algorithms and location-based matching.
 
 import hashlib
 import re
-from collections import defaultdict
-from typing import Dict, List, Set, Tuple
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
 
 from omniaudit.harmonizer.types import DeduplicationConfig, Finding
 
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=8192)
+def _token_set(text: str) -> FrozenSet[str]:
+    """Lowercased word tokens of ``text``, ignoring single characters."""
+    tokens = _NON_WORD_RE.sub(" ", text.lower()).split()
+    return frozenset(t for t in tokens if len(t) > 1)
+
+
+class _UnionFind:
+    """Disjoint-set forest over integer indices with path compression."""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        """Return the representative of ``i``'s set."""
+        parent = self.parent
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    def union(self, i: int, j: int) -> None:
+        """Merge the sets containing ``i`` and ``j``."""
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            # Keep the earliest index as root so group order follows input order
+            if root_j < root_i:
+                root_i, root_j = root_j, root_i
+            self.parent[root_j] = root_i
+
 
 class Deduplicator:
     """
@@ -27,7 +63,8 @@ class Deduplicator:
     def __init__(self, config: DeduplicationConfig):
         """Initialize deduplicator with configuration."""
         self.config = config
-        self._similarity_cache: Dict[Tuple[str, str], float] = {}
+        self._similarity_cache: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._config_dump = config.model_dump()
 
     def deduplicate(self, findings: List[Finding]) -> Tuple[List[Finding], Dict[str, str]]:
         """
@@ -69,36 +106,57 @@ class Deduplicator:
         """
         Build groups of similar findings.
 
+        Similar pairs are merged with a union-find, so each group is a
+        connected component of the similarity relation and does not depend
+        on input order. Findings within a group keep their input order.
+
         Args:
             findings: List of findings
 
         Returns:
             List of groups, where each group contains similar findings
         """
-        # Track which findings have been grouped
-        grouped_ids: Set[str] = set()
-        groups: List[List[Finding]] = []
+        groups = _UnionFind(len(findings))
 
-        for i, finding1 in enumerate(findings):
-            if finding1.id in grouped_ids:
+        for i, j in self._candidate_pairs(findings):
+            # Skip pairs an earlier merge already connected
+            if groups.find(i) == groups.find(j):
                 continue
 
-            # Start a new group
-            group = [finding1]
-            grouped_ids.add(finding1.id)
+            if self._are_similar(findings[i], findings[j]):
+                groups.union(i, j)
 
-            # Find all similar findings
-            for finding2 in findings[i + 1 :]:
-                if finding2.id in grouped_ids:
-                    continue
+        members: Dict[int, List[Finding]] = defaultdict(list)
+        for i, finding in enumerate(findings):
+            members[groups.find(i)].append(finding)
 
-                if self._are_similar(finding1, finding2):
-                    group.append(finding2)
-                    grouped_ids.add(finding2.id)
+        return list(members.values())
 
-            groups.append(group)
+    def _candidate_pairs(self, findings: List[Finding]) -> Iterator[Tuple[int, int]]:
+        """
+        Yield index pairs of findings that could be duplicates.
 
-        return groups
+        _are_similar rejects pairs with different categories, and with
+        different files when location is considered, so findings are
+        bucketed on those keys first and only paired within a bucket.
+
+        Args:
+            findings: List of findings
+
+        Yields:
+            (i, j) index pairs with i < j
+        """
+        buckets: Dict[Tuple[str, Optional[str]], List[int]] = defaultdict(list)
+        for i, finding in enumerate(findings):
+            file_key = finding.file_path if self.config.consider_location else None
+            buckets[(finding.category, file_key)].append(i)
+
+        for indices in buckets.values():
+            if len(indices) < 2:
+                continue
+            for pos, i in enumerate(indices):
+                for j in indices[pos + 1 :]:
+                    yield i, j
 
     def _are_similar(self, finding1: Finding, finding2: Finding) -> bool:
         """
@@ -173,8 +231,10 @@ class Deduplicator:
         """
         # Check cache
         cache_key = self._get_cache_key(text1, text2)
-        if cache_key in self._similarity_cache:
-            return self._similarity_cache[cache_key]
+        cached = self._similarity_cache.get(cache_key)
+        if cached is not None:
+            self._similarity_cache.move_to_end(cache_key)
+            return cached
 
         # Exact match
         if text1 == text2:
@@ -191,8 +251,10 @@ class Deduplicator:
             # Semantic similarity using token-based Jaccard similarity
             similarity = self._jaccard_similarity(text1, text2)
 
-        # Cache the result
+        # Cache the result, evicting the least recently used entry when full
         self._similarity_cache[cache_key] = similarity
+        if len(self._similarity_cache) > self.config.cache_max_size:
+            self._similarity_cache.popitem(last=False)
         return similarity
 
     def _jaccard_similarity(self, text1: str, text2: str) -> float:
@@ -206,35 +268,16 @@ class Deduplicator:
         Returns:
             Jaccard similarity score (0.0 to 1.0)
         """
-        # Tokenize and normalize
-        tokens1 = set(self._tokenize(text1.lower()))
-        tokens2 = set(self._tokenize(text2.lower()))
+        # Tokenize and normalize (memoized per message)
+        tokens1 = _token_set(text1)
+        tokens2 = _token_set(text2)
 
         if not tokens1 or not tokens2:
             return 0.0
 
         # Jaccard similarity: |intersection| / |union|
-        intersection = tokens1 & tokens2
-        union = tokens1 | tokens2
-
-        return len(intersection) / len(union)
-
-    def _tokenize(self, text: str) -> List[str]:
-        """
-        Tokenize text into words.
-
-        Args:
-            text: Text to tokenize
-
-        Returns:
-            List of tokens
-        """
-        # Remove special characters and split on whitespace
-        text = re.sub(r"[^\w\s]", " ", text)
-        tokens = text.split()
-
-        # Filter out very short tokens
-        return [t for t in tokens if len(t) > 1]
+        intersection = len(tokens1 & tokens2)
+        return intersection / (len(tokens1) + len(tokens2) - intersection)
 
     def _get_cache_key(self, text1: str, text2: str) -> Tuple[str, str]:
         """
@@ -263,9 +306,13 @@ class Deduplicator:
         """
         return {
             "cache_size": len(self._similarity_cache),
-            "config": self.config.model_dump(),
+            "config": dict(self._config_dump),
         }
 
+    def refresh_config(self) -> None:
+        """Re-serialize the configuration after it has been changed in place."""
+        self._config_dump = self.config.model_dump()
+
     def clear_cache(self) -> None:
         """Clear similarity cache."""
         self._similarity_cache.clear()
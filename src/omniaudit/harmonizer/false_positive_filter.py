@@ -8,11 +8,38 @@ techniques, including pattern recognition, anomaly detection, and historical ana
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from omniaudit.harmonizer.patterns import keyword_regex
 from omniaudit.harmonizer.types import FalsePositiveConfig, Finding, Severity
 
 
+# High severity indicators
+_HIGH_SEVERITY_WORDS = keyword_regex(
+    ["critical", "security", "vulnerability", "exploit", "injection", "unsafe", "dangerous"]
+)
+
+# Low severity indicators
+_LOW_SEVERITY_WORDS = keyword_regex(
+    ["style", "formatting", "convention", "suggestion", "prefer", "consider", "could"]
+)
+
+# Generic words ("error", "warning", "issue", ...) that carry little detail
+_GENERIC_WORDS = keyword_regex(["error", "warning", "issue", "problem", "invalid"])
+
+# Severity groups used by the consistency and test-file checks
+_HIGH_SEVERITIES = frozenset({Severity.CRITICAL, Severity.HIGH})
+_LOW_SEVERITIES = frozenset({Severity.LOW, Severity.INFO})
+
+# Categories that are still reported in documentation files
+_SECURITY_CATEGORIES = frozenset({"security", "vulnerability"})
+
+# Known third-party directories
+_THIRD_PARTY_INDICATORS = keyword_regex(
+    ["node_modules", "vendor", "site-packages", ".cargo", "target/debug", "target/release"]
+)
+
+
 class FalsePositiveFilter:
     """
     Filters out likely false positive findings using ML heuristics.
@@ -71,21 +98,74 @@ class FalsePositiveFilter:
         r"too.*few.*public.*methods",  # Intentional design choice
     ]
 
+    # Compiled forms of the class-level patterns, shared by all instances
+    _CLASS_COMPILED_PATTERNS: Optional[Dict[str, re.Pattern]] = None
+    _CLASS_COMPILED_MESSAGES: Optional[re.Pattern] = None
+
     def __init__(self, config: FalsePositiveConfig):
         """Initialize false positive filter with configuration."""
         self.config = config
         self._compiled_patterns = self._compile_patterns()
-        self._compiled_messages = [
-            re.compile(pattern, re.IGNORECASE) for pattern in self.FALSE_POSITIVE_MESSAGES
-        ]
+        self._compiled_messages = self._compile_messages()
+
+        # Findings cluster in a small set of files and lint rules fire
+        # repeatedly with identical text, so path-only checks (including the
+        # filesystem resolve) and whole analyses are memoized. The memos
+        # depend on the config and are rebuilt by _reset_caches().
+        self._config_key: Optional[Tuple[float, bool, Tuple[str, ...]]] = None
+        self._compiled_whitelist: List[re.Pattern] = []
+        self._path_cache: Dict[str, Tuple[bool, Tuple[str, ...], bool, bool]] = {}
+        self._deep_path_cache: Dict[str, bool] = {}
+        self._analysis_cache: Dict[
+            Tuple[str, Severity, str, str, Optional[str]], Tuple[bool, float, Tuple[str, ...]]
+        ] = {}
+        self._reset_caches()
+
+    @classmethod
+    def _compile_patterns(cls) -> Dict[str, re.Pattern]:
+        """Compile each category's patterns into a single alternation regex (once per class)."""
+        # Look in the class's own namespace so subclasses overriding
+        # FALSE_POSITIVE_PATTERNS don't reuse the parent's compiled forms
+        compiled = cls.__dict__.get("_CLASS_COMPILED_PATTERNS")
+        if compiled is None:
+            compiled = {
+                category: re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+                for category, patterns in cls.FALSE_POSITIVE_PATTERNS.items()
+            }
+            cls._CLASS_COMPILED_PATTERNS = compiled
+        return compiled
 
-    def _compile_patterns(self) -> Dict[str, List[re.Pattern]]:
-        """Compile regex patterns for efficiency."""
-        compiled = {}
-        for category, patterns in self.FALSE_POSITIVE_PATTERNS.items():
-            compiled[category] = [re.compile(pattern) for pattern in patterns]
+    @classmethod
+    def _compile_messages(cls) -> re.Pattern:
+        """Compile the false positive message patterns into one alternation (once per class)."""
+        compiled = cls.__dict__.get("_CLASS_COMPILED_MESSAGES")
+        if compiled is None:
+            compiled = re.compile(
+                "|".join(f"(?:{pattern})" for pattern in cls.FALSE_POSITIVE_MESSAGES),
+                re.IGNORECASE,
+            )
+            cls._CLASS_COMPILED_MESSAGES = compiled
         return compiled
 
+    def _get_config_key(self) -> Tuple[float, bool, Tuple[str, ...]]:
+        """Config values the memoized checks depend on."""
+        return (
+            self.config.confidence_threshold,
+            self.config.use_ml_heuristics,
+            tuple(self.config.whitelist_patterns),
+        )
+
+    def _reset_caches(self) -> None:
+        """Drop memoized checks and recompile the whitelist from the current config."""
+        self._config_key = self._get_config_key()
+        # Whitelist patterns come from the config, so they stay per instance
+        self._compiled_whitelist = [
+            re.compile(pattern, re.IGNORECASE) for pattern in self.config.whitelist_patterns
+        ]
+        self._path_cache.clear()
+        self._deep_path_cache.clear()
+        self._analysis_cache.clear()
+
     def filter(self, findings: List[Finding]) -> Tuple[List[Finding], List[Finding]]:
         """
         Filter findings to separate likely false positives.
@@ -96,32 +176,69 @@ class FalsePositiveFilter:
         Returns:
             Tuple of (valid_findings, false_positives)
         """
+        valid_findings, false_positives, _ = self.filter_with_analyses(findings)
+        return valid_findings, false_positives
+
+    def filter_with_analyses(
+        self, findings: List[Finding]
+    ) -> Tuple[List[Finding], List[Finding], Dict[str, Tuple[bool, float, List[str]]]]:
+        """
+        Filter findings and keep the analysis computed for each one.
+
+        The analyses are also retained so that analyze_finding() can answer
+        for findings from this batch without re-running the checks.
+
+        Args:
+            findings: List of findings to filter
+
+        Returns:
+            Tuple of (valid_findings, false_positives, analyses), where
+            analyses maps finding ID to (is_false_positive, confidence, reasons)
+        """
+        # Memoize per call, so memory stays bounded by the batch and config
+        # changes between calls take effect
+        self._reset_caches()
+
         if not self.config.enabled:
-            return findings, []
+            return findings, [], {}
 
         valid_findings = []
         false_positives = []
+        analyses = {}
+        threshold = self.config.confidence_threshold
 
         for finding in findings:
-            is_fp, confidence, reasons = self._is_false_positive(finding)
+            is_fp, confidence, reasons = self._analyze_fields(
+                finding.file_path,
+                finding.severity,
+                finding.category,
+                finding.message,
+                finding.rule_id,
+            )
+            analyses[finding.id] = (is_fp, confidence, list(reasons))
 
-            if is_fp and confidence >= self.config.confidence_threshold:
+            if is_fp and confidence >= threshold:
                 false_positives.append(finding)
             else:
                 valid_findings.append(finding)
 
-        return valid_findings, false_positives
+        return valid_findings, false_positives, analyses
 
     def analyze_finding(self, finding: Finding) -> Tuple[bool, float, List[str]]:
         """
         Analyze a single finding for false positive likelihood.
 
+        Reuses the analysis from the most recent filter() call when a finding
+        with the same analysed fields was part of that batch.
+
         Args:
             finding: Finding to analyze
 
         Returns:
             Tuple of (is_false_positive, confidence, reasons)
         """
+        if self._get_config_key() != self._config_key:
+            self._reset_caches()
         return self._is_false_positive(finding)
 
     def _is_false_positive(self, finding: Finding) -> Tuple[bool, float, List[str]]:
@@ -134,62 +251,128 @@ class FalsePositiveFilter:
         Returns:
             Tuple of (is_false_positive, confidence, reasons)
         """
+        is_fp, confidence, reasons = self._analyze_fields(
+            finding.file_path,
+            finding.severity,
+            finding.category,
+            finding.message,
+            finding.rule_id,
+        )
+        return is_fp, confidence, list(reasons)
+
+    def _analyze_fields(
+        self,
+        file_path: str,
+        severity: Severity,
+        category: str,
+        message: str,
+        rule_id: Optional[str],
+    ) -> Tuple[bool, float, Tuple[str, ...]]:
+        """Memoized _compute_analysis."""
+        key = (file_path, severity, category, message, rule_id)
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            analysis = self._analysis_cache[key] = self._compute_analysis(*key)
+        return analysis
+
+    def _compute_analysis(
+        self,
+        file_path: str,
+        severity: Severity,
+        category: str,
+        message: str,
+        rule_id: Optional[str],
+    ) -> Tuple[bool, float, Tuple[str, ...]]:
+        """
+        Run the false positive checks on the fields of a finding.
+
+        Args:
+            file_path: Finding file path
+            severity: Finding severity
+            category: Finding category
+            message: Finding message
+            rule_id: Finding rule ID
+
+        Returns:
+            Tuple of (is_false_positive, confidence, reasons)
+        """
+        threshold = self.config.confidence_threshold
         confidence_scores = []
-        reasons = []
+        reasons: List[str] = []
 
-        # Check whitelisted patterns
-        for pattern in self.config.whitelist_patterns:
-            if re.search(pattern, finding.file_path, re.IGNORECASE):
-                confidence_scores.append(0.9)
-                reasons.append(f"Matches whitelist pattern: {pattern}")
+        # Checks run highest-confidence first so an obvious false positive
+        # returns as soon as one score reaches the threshold
 
-        # Check if in test files
-        if self._matches_category("test_files", finding.file_path):
-            # Test files with low severity issues are often false positives
-            if finding.severity in [Severity.LOW, Severity.INFO]:
-                confidence_scores.append(0.8)
-                reasons.append("Low severity issue in test file")
+        # Path-derived checks are shared by every finding in the same file
+        generated, whitelisted, documentation, test_file = self._path_signals(file_path)
 
         # Check if in generated code
-        if self._matches_category("generated_code", finding.file_path):
-            confidence_scores.append(0.95)
+        if generated:
             reasons.append("Finding in generated/third-party code")
+            if 0.95 >= threshold:
+                return True, 0.95, tuple(reasons)
+            confidence_scores.append(0.95)
+
+        # Check whitelisted patterns
+        for pattern in whitelisted:
+            reasons.append(f"Matches whitelist pattern: {pattern}")
+            if 0.9 >= threshold:
+                return True, 0.9, tuple(reasons)
+            confidence_scores.append(0.9)
 
         # Check if in documentation
-        if self._matches_category("documentation", finding.file_path):
-            if finding.category not in ["security", "vulnerability"]:
-                confidence_scores.append(0.85)
+        if documentation:
+            if category not in _SECURITY_CATEGORIES:
                 reasons.append("Non-security issue in documentation")
+                if 0.85 >= threshold:
+                    return True, 0.85, tuple(reasons)
+                confidence_scores.append(0.85)
+
+        # Check if in test files
+        if test_file:
+            # Test files with low severity issues are often false positives
+            if severity in _LOW_SEVERITIES:
+                reasons.append("Low severity issue in test file")
+                if 0.8 >= threshold:
+                    return True, 0.8, tuple(reasons)
+                confidence_scores.append(0.8)
 
         # Check message patterns
-        for pattern in self._compiled_messages:
-            if pattern.search(finding.message):
-                confidence_scores.append(0.7)
-                reasons.append(f"Message matches known false positive pattern")
-                break
+        if self._compiled_messages.search(message):
+            reasons.append(f"Message matches known false positive pattern")
+            if 0.7 >= threshold:
+                return True, 0.7, tuple(reasons)
+            confidence_scores.append(0.7)
+
+        # Lowercase and tokenize once for the message-based checks below
+        message_lower = message.lower()
 
         # Check severity-message consistency
-        consistency_score = self._check_severity_consistency(finding)
+        consistency_score = self._check_severity_consistency(severity, message_lower)
         if consistency_score < 0.5:
-            confidence_scores.append(0.6)
             reasons.append("Severity doesn't match message severity")
+            if 0.6 >= threshold:
+                return True, 0.6, tuple(reasons)
+            confidence_scores.append(0.6)
 
         # Use ML heuristics if enabled
         if self.config.use_ml_heuristics:
-            ml_score = self._apply_ml_heuristics(finding)
+            ml_score = self._apply_ml_heuristics(
+                file_path, severity, category, rule_id, message_lower, message_lower.split()
+            )
             if ml_score > 0.5:
                 confidence_scores.append(ml_score)
                 reasons.append(f"ML heuristic score: {ml_score:.2f}")
 
         # Calculate overall confidence
         if not confidence_scores:
-            return False, 0.0, []
+            return False, 0.0, ()
 
         # Take the maximum confidence score
         confidence = max(confidence_scores)
 
-        is_fp = confidence >= self.config.confidence_threshold
-        return is_fp, confidence, reasons
+        is_fp = confidence >= threshold
+        return is_fp, confidence, tuple(reasons)
 
     def _matches_category(self, category: str, file_path: str) -> bool:
         """
@@ -202,61 +385,96 @@ class FalsePositiveFilter:
         Returns:
             True if matches any pattern in category
         """
-        if category not in self._compiled_patterns:
+        pattern = self._compiled_patterns.get(category)
+        return pattern is not None and pattern.search(file_path) is not None
+
+    def _path_signals(self, file_path: str) -> Tuple[bool, Tuple[str, ...], bool, bool]:
+        """Memoized _compute_path_signals."""
+        signals = self._path_cache.get(file_path)
+        if signals is None:
+            signals = self._path_cache[file_path] = self._compute_path_signals(file_path)
+        return signals
+
+    def _is_deep_or_third_party(self, file_path: str) -> bool:
+        """Memoized _compute_deep_or_third_party."""
+        deep = self._deep_path_cache.get(file_path)
+        if deep is None:
+            deep = self._deep_path_cache[file_path] = self._compute_deep_or_third_party(file_path)
+        return deep
+
+    def _compute_path_signals(self, file_path: str) -> Tuple[bool, Tuple[str, ...], bool, bool]:
+        """
+        Evaluate the path-only checks for a file.
+
+        Args:
+            file_path: File path to check
+
+        Returns:
+            Tuple of (generated_code, matching whitelist patterns,
+            documentation, test_files)
+        """
+        return (
+            self._matches_category("generated_code", file_path),
+            tuple(p.pattern for p in self._compiled_whitelist if p.search(file_path)),
+            self._matches_category("documentation", file_path),
+            self._matches_category("test_files", file_path),
+        )
+
+    def _compute_deep_or_third_party(self, file_path: str) -> bool:
+        """
+        Check whether a file sits in third-party code or a very deep directory.
+
+        Security Note:
+            Path depth calculation uses normalized paths to prevent
+            manipulation via crafted paths (e.g., "../../../").
+
+        Args:
+            file_path: File path to check
+
+        Returns:
+            True if the depth heuristic applies
+        """
+        # Normalize path to prevent manipulation via relative paths or symlinks
+        try:
+            # Normalize the path to resolve any relative components
+            normalized_path = str(Path(file_path).resolve())
+        except Exception:
+            # If path normalization fails, skip this heuristic
             return False
 
-        for pattern in self._compiled_patterns[category]:
-            if pattern.search(file_path):
-                return True
+        # Count depth based on normalized path
+        path_depth = normalized_path.count(os.sep)
 
-        return False
+        # Additional security: Check for known third-party directories
+        # rather than relying solely on depth
+        is_third_party = _THIRD_PARTY_INDICATORS.search(normalized_path) is not None
 
-    def _check_severity_consistency(self, finding: Finding) -> float:
+        # Only apply depth heuristic if path seems legitimate and deep
+        return is_third_party or path_depth > 10
+
+    def _check_severity_consistency(self, severity: Severity, message_lower: str) -> float:
         """
         Check if severity is consistent with message content.
 
         Args:
-            finding: Finding to check
+            severity: Finding severity
+            message_lower: Lowercased finding message
 
         Returns:
             Consistency score (0.0 to 1.0)
         """
-        message_lower = finding.message.lower()
-
-        # High severity indicators
-        high_severity_words = [
-            "critical",
-            "security",
-            "vulnerability",
-            "exploit",
-            "injection",
-            "unsafe",
-            "dangerous",
-        ]
-
-        # Low severity indicators
-        low_severity_words = [
-            "style",
-            "formatting",
-            "convention",
-            "suggestion",
-            "prefer",
-            "consider",
-            "could",
-        ]
-
-        has_high_indicators = any(word in message_lower for word in high_severity_words)
-        has_low_indicators = any(word in message_lower for word in low_severity_words)
+        has_high_indicators = _HIGH_SEVERITY_WORDS.search(message_lower) is not None
+        has_low_indicators = _LOW_SEVERITY_WORDS.search(message_lower) is not None
 
         # Check consistency
-        if finding.severity in [Severity.CRITICAL, Severity.HIGH]:
+        if severity in _HIGH_SEVERITIES:
             if has_high_indicators:
                 return 1.0  # Consistent
             elif has_low_indicators:
                 return 0.2  # Inconsistent
             else:
                 return 0.6  # Neutral
-        elif finding.severity in [Severity.LOW, Severity.INFO]:
+        elif severity in _LOW_SEVERITIES:
             if has_low_indicators:
                 return 1.0  # Consistent
             elif has_high_indicators:
@@ -266,7 +484,15 @@ class FalsePositiveFilter:
         else:
             return 0.7  # Medium severity - usually consistent
 
-    def _apply_ml_heuristics(self, finding: Finding) -> float:
+    def _apply_ml_heuristics(
+        self,
+        file_path: str,
+        severity: Severity,
+        category: str,
+        rule_id: Optional[str],
+        message_lower: str,
+        tokens: List[str],
+    ) -> float:
         """
         Apply ML-based heuristics to detect false positives.
 
@@ -277,75 +503,45 @@ class FalsePositiveFilter:
         - Category patterns
 
         Args:
-            finding: Finding to analyze
+            file_path: Finding file path
+            severity: Finding severity
+            category: Finding category
+            rule_id: Finding rule ID
+            message_lower: Lowercased finding message
+            tokens: Whitespace-split tokens of message_lower
 
         Returns:
             False positive probability (0.0 to 1.0)
-
-        Security Note:
-            Path depth calculation uses normalized paths to prevent
-            manipulation via crafted paths (e.g., "../../../").
         """
         score = 0.0
 
         # Feature 1: Message length (very short messages are often generic)
-        message_length = len(finding.message.split())
+        message_length = len(tokens)
         if message_length < 3:
             score += 0.2
 
         # Feature 2: Generic messages (contain words like "error", "warning", "issue")
-        generic_words = ["error", "warning", "issue", "problem", "invalid"]
-        generic_count = sum(
-            1 for word in generic_words if word in finding.message.lower()
-        )
-        if generic_count > 0 and message_length < 8:
+        # Only short messages count, so longer ones skip the scan
+        if message_length < 8 and _GENERIC_WORDS.search(message_lower):
             score += 0.15
 
         # Feature 3: File depth (with path normalization to prevent bypass)
-        # Normalize path to prevent manipulation via relative paths or symlinks
-        try:
-            # Normalize the path to resolve any relative components
-            normalized_path = str(Path(finding.file_path).resolve())
-
-            # Count depth based on normalized path
-            path_depth = normalized_path.count(os.sep)
-
-            # Additional security: Check for known third-party directories
-            # rather than relying solely on depth
-            third_party_indicators = [
-                "node_modules",
-                "vendor",
-                "site-packages",
-                ".cargo",
-                "target/debug",
-                "target/release",
-            ]
-
-            is_third_party = any(
-                indicator in normalized_path for indicator in third_party_indicators
-            )
-
-            # Only apply depth heuristic if path seems legitimate and deep
-            if is_third_party or path_depth > 10:
-                score += 0.1
-
-        except Exception:
-            # If path normalization fails, skip this heuristic
-            pass
+        if self._is_deep_or_third_party(file_path):
+            score += 0.1
 
         # Feature 4: Rule ID patterns (some tools have known false positive rules)
-        if finding.rule_id:
+        if rule_id:
             # Example: rules ending in "001" are often too generic
-            if finding.rule_id.endswith("001"):
+            if rule_id.endswith("001"):
                 score += 0.05
 
         # Feature 5: Category + Severity combination
         # Low severity "style" issues are often false positives
-        if finding.category == "style" and finding.severity == Severity.LOW:
+        if category == "style" and severity == Severity.LOW:
             score += 0.15
 
         # Feature 6: Info severity findings without specific details
-        if finding.severity == Severity.INFO and message_length < 10:
+        if severity == Severity.INFO and message_length < 10:
             score += 0.2
 
         # Normalize score to 0-1 range
@@ -377,3 +573,9 @@ class FalsePositiveFilter:
             "filter_enabled": self.config.enabled,
             "confidence_threshold": self.config.confidence_threshold,
         }
+
+
+# Compile the built-in patterns at import time so constructing a filter does
+# no regex compilation beyond its configured whitelist
+FalsePositiveFilter._compile_patterns()
+FalsePositiveFilter._compile_messages()
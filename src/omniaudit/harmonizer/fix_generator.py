@@ -5,10 +5,20 @@ This module generates automatic fixes for findings with confidence scores
 and validation steps.
 """
 
-import hashlib
+import asyncio
 import logging
-from typing import List, Optional
-
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from omniaudit.harmonizer.ai_client import (
+    ANTHROPIC_AVAILABLE,
+    async_anthropic_client,
+    get_anthropic_client,
+    get_async_anthropic_client,
+)
 from omniaudit.harmonizer.types import (
     AutoFix,
     ConfidenceLevel,
@@ -18,15 +28,28 @@ from omniaudit.harmonizer.types import (
     RootCauseInfo,
 )
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+
 logger = logging.getLogger(__name__)
 
-# Try to import Anthropic SDK
-try:
-    from anthropic import Anthropic
+# Model used for AI-generated fixes
+_AI_FIX_MODEL = "claude-sonnet-4-5"
+
+# Lower bounds of each confidence level above VERY_LOW, in ascending order
+_SCORE_THRESHOLDS = (0.25, 0.50, 0.75, 0.90)
+_SCORE_LEVELS = (
+    ConfidenceLevel.VERY_LOW,
+    ConfidenceLevel.LOW,
+    ConfidenceLevel.MEDIUM,
+    ConfidenceLevel.HIGH,
+    ConfidenceLevel.VERY_HIGH,
+)
 
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# AI fix responses: each section runs from "FIX " to the next "FIX " and
+# holds "KEY: value" lines
+_AI_FIX_SECTION_RE = re.compile(r"FIX (.*?)(?=FIX |\Z)", re.DOTALL)
+_AI_FIX_FIELD_RE = re.compile(r"^([^:\n]*):(.*)$", re.MULTILINE)
 
 
 class FixGenerator:
@@ -126,10 +149,32 @@ class FixGenerator:
             anthropic_api_key: Optional Anthropic API key for AI-generated fixes
         """
         self.config = config
-        self._client: Optional[Anthropic] = None
+        self._api_key: Optional[str] = None
+        self._client: Optional["Anthropic"] = None
+
+        # Inverted index: template keyword -> templates containing it
+        keyword_templates: Dict[str, Set[str]] = defaultdict(set)
+        for template_key in self.FIX_TEMPLATES:
+            for keyword in template_key.split("_"):
+                keyword_templates[keyword].add(template_key)
+
+        # One lookahead alternation reports the longest keyword starting at
+        # each position; keywords that are prefixes of it (and so start at
+        # the same position) are folded into its entry
+        keywords = sorted(keyword_templates, key=len, reverse=True)
+        self._template_keyword_re = re.compile(
+            "(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))"
+        )
+        self._template_index: Dict[str, Set[str]] = {
+            keyword: set().union(
+                *(keyword_templates[k] for k in keywords if keyword.startswith(k))
+            )
+            for keyword in keywords
+        }
 
         if config.use_ai and ANTHROPIC_AVAILABLE and anthropic_api_key:
-            self._client = Anthropic(api_key=anthropic_api_key)
+            self._api_key = anthropic_api_key
+            self._client = get_anthropic_client(anthropic_api_key)
 
     def generate_fixes(
         self,
@@ -160,13 +205,71 @@ class FixGenerator:
             ai_fixes = self._generate_ai_fixes(finding, root_cause)
             fixes.extend(ai_fixes)
 
+        return self._finalize_fixes(fixes)
+
+    async def generate_fixes_batch(
+        self,
+        findings_and_causes: Sequence[Tuple[Finding, Optional[RootCauseInfo]]],
+    ) -> List[List[AutoFix]]:
+        """
+        Generate fixes for many findings, issuing AI requests concurrently.
+
+        Template fixes are built synchronously; the AI requests for findings
+        that still need fixes run together, capped at
+        ``config.max_concurrent_ai_requests`` in flight.
+
+        Args:
+            findings_and_causes: (finding, optional root cause) pairs
+
+        Returns:
+            Fixes for each pair, in input order
+        """
+        if not self.config.enabled:
+            return [[] for _ in findings_and_causes]
+
+        all_fixes = [
+            self._generate_template_fixes(finding, root_cause)
+            for finding, root_cause in findings_and_causes
+        ]
+
+        if self.config.use_ai and self._client:
+            semaphore = asyncio.Semaphore(self.config.max_concurrent_ai_requests)
+
+            async def limited(finding: Finding, root_cause: Optional[RootCauseInfo]):
+                async with semaphore:
+                    return await self._generate_ai_fixes_async(finding, root_cause)
+
+            pending = [
+                index
+                for index, fixes in enumerate(all_fixes)
+                if len(fixes) < self.config.max_fixes_per_finding
+            ]
+            async with async_anthropic_client(self._api_key):
+                results = await asyncio.gather(
+                    *(limited(*findings_and_causes[index]) for index in pending),
+                    return_exceptions=True,
+                )
+            for index, ai_fixes in zip(pending, results):
+                if not isinstance(ai_fixes, BaseException):
+                    all_fixes[index].extend(ai_fixes)
+
+        return [self._finalize_fixes(fixes) for fixes in all_fixes]
+
+    def _finalize_fixes(self, fixes: List[AutoFix]) -> List[AutoFix]:
+        """
+        Apply the confidence threshold and per-finding limit.
+
+        Args:
+            fixes: Candidate fixes
+
+        Returns:
+            Fixes to suggest
+        """
         # Filter by confidence threshold
         fixes = [f for f in fixes if f.confidence_score >= self.config.min_confidence]
 
         # Limit to max fixes
-        fixes = fixes[: self.config.max_fixes_per_finding]
-
-        return fixes
+        return fixes[: self.config.max_fixes_per_finding]
 
     def _generate_template_fixes(
         self, finding: Finding, root_cause: Optional[RootCauseInfo] = None
@@ -184,12 +287,16 @@ class FixGenerator:
         fixes = []
 
         # Try to match finding to a template
-        message_lower = finding.message.lower()
+        message_lower = finding.message_lower
         rule_id_lower = (finding.rule_id or "").lower()
 
+        applicable = self._applicable_templates(message_lower, rule_id_lower)
+        if not applicable:
+            return fixes
+
+        # Iterate in template order so fixes keep a stable ordering
         for template_key, template in self.FIX_TEMPLATES.items():
-            # Check if template applies
-            if self._template_applies(template_key, message_lower, rule_id_lower):
+            if template_key in applicable:
                 fix = self._build_fix_from_template(
                     finding, template_key, template, root_cause
                 )
@@ -197,23 +304,24 @@ class FixGenerator:
 
         return fixes
 
-    def _template_applies(self, template_key: str, message: str, rule_id: str) -> bool:
+    def _applicable_templates(self, message: str, rule_id: str) -> Set[str]:
         """
-        Check if a template applies to a finding.
+        Find the templates that apply to a finding.
+
+        A template applies when any of its keywords appears in the message
+        or rule ID.
 
         Args:
-            template_key: Template identifier
             message: Finding message (lowercase)
             rule_id: Finding rule ID (lowercase)
 
         Returns:
-            True if template applies
+            Keys of applicable templates
         """
-        # Simple keyword matching
-        keywords = template_key.replace("_", " ").split()
-
-        # Check if any keyword appears in message or rule ID
-        return any(keyword in message or keyword in rule_id for keyword in keywords)
+        applicable: Set[str] = set()
+        for keyword in self._template_keyword_re.findall(f"{message}\n{rule_id}"):
+            applicable.update(self._template_index[keyword])
+        return applicable
 
     def _build_fix_from_template(
         self,
@@ -280,46 +388,113 @@ class FixGenerator:
             return []
 
         try:
-            # Build prompt
-            prompt = self._build_fix_prompt(finding, root_cause)
-
-            # Call API with timeout and proper configuration
-            # Validate model exists before calling
-            model_name = "claude-sonnet-4-5"
-
             response = self._client.messages.create(
-                model=model_name,
-                max_tokens=1500,
-                messages=[{"role": "user", "content": prompt}],
-                timeout=30.0,  # 30 second timeout to prevent hanging
+                **self._build_ai_request(finding, root_cause)
             )
+            return self._handle_ai_response(response, finding)
+
+        except Exception as e:
+            self._log_ai_failure(finding, e)
+            return []
+
+    async def _generate_ai_fixes_async(
+        self, finding: Finding, root_cause: Optional[RootCauseInfo] = None
+    ) -> List[AutoFix]:
+        """
+        Generate fixes using AI without blocking the event loop.
+
+        Args:
+            finding: Finding to fix
+            root_cause: Optional root cause
+
+        Returns:
+            List of AI-generated fixes
+        """
+        if not self._client:
+            return []
 
-            # Parse response
-            response_text = response.content[0].text
-            logger.info(
-                "AI fix generation successful",
-                extra={
-                    "finding_id": finding.id,
-                    "finding_category": finding.category,
-                    "model": model_name,
-                },
+        try:
+            response = await self._get_async_client().messages.create(
+                **self._build_ai_request(finding, root_cause)
             )
-            return self._parse_ai_fix_response(response_text, finding)
+            return self._handle_ai_response(response, finding)
 
         except Exception as e:
-            # Log error with context instead of silently failing
-            logger.error(
-                "AI fix generation failed",
-                extra={
-                    "finding_id": finding.id,
-                    "finding_category": finding.category,
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                },
-                exc_info=True,
-            )
+            self._log_ai_failure(finding, e)
             return []
 
+    def _get_async_client(self) -> "AsyncAnthropic":
+        """
+        Get the async client opened for this analysis.
+
+        Returns:
+            AsyncAnthropic client shared by every AI stage of the run
+        """
+        return get_async_anthropic_client(self._api_key)
+
+    def _build_ai_request(
+        self, finding: Finding, root_cause: Optional[RootCauseInfo]
+    ) -> Dict[str, Any]:
+        """
+        Build the messages.create arguments for an AI fix request.
+
+        Args:
+            finding: Finding to fix
+            root_cause: Optional root cause
+
+        Returns:
+            Keyword arguments for the Anthropic client
+        """
+        return {
+            "model": _AI_FIX_MODEL,
+            "max_tokens": 1500,
+            "messages": [
+                {"role": "user", "content": self._build_fix_prompt(finding, root_cause)}
+            ],
+            "timeout": 30.0,  # 30 second timeout to prevent hanging
+        }
+
+    def _handle_ai_response(self, response: Any, finding: Finding) -> List[AutoFix]:
+        """
+        Log a successful AI response and parse it into fixes.
+
+        Args:
+            response: Anthropic messages response
+            finding: Original finding
+
+        Returns:
+            List of AutoFix objects
+        """
+        response_text = response.content[0].text
+        logger.info(
+            "AI fix generation successful",
+            extra={
+                "finding_id": finding.id,
+                "finding_category": finding.category,
+                "model": _AI_FIX_MODEL,
+            },
+        )
+        return self._parse_ai_fix_response(response_text, finding)
+
+    def _log_ai_failure(self, finding: Finding, error: Exception) -> None:
+        """
+        Log a failed AI fix request with context instead of silently failing.
+
+        Args:
+            finding: Finding being fixed
+            error: Exception raised by the request
+        """
+        logger.error(
+            "AI fix generation failed",
+            extra={
+                "finding_id": finding.id,
+                "finding_category": finding.category,
+                "error_type": type(error).__name__,
+                "error_message": str(error),
+            },
+            exc_info=True,
+        )
+
     def _build_fix_prompt(self, finding: Finding, root_cause: Optional[RootCauseInfo]) -> str:
         """
         Build prompt for AI fix generation.
@@ -382,8 +557,6 @@ Be practical and specific. Focus on fixes that can realistically be implemented.
         Returns:
             Sanitized code snippet
         """
-        import re
-
         # Patterns for common secrets
         sanitized = code
 
@@ -425,11 +598,9 @@ Be practical and specific. Focus on fixes that can realistically be implemented.
         """
         fixes = []
 
-        # Split by fix sections
-        fix_sections = response.split("FIX ")
-        for section in fix_sections[1:]:  # Skip first empty section
+        for match in _AI_FIX_SECTION_RE.finditer(response):
             try:
-                fix = self._parse_fix_section(section, finding)
+                fix = self._parse_fix_section(match.group(1), finding)
                 if fix:
                     fixes.append(fix)
             except Exception:
@@ -448,14 +619,10 @@ Be practical and specific. Focus on fixes that can realistically be implemented.
         Returns:
             AutoFix if successful, None otherwise
         """
-        lines = section.strip().split("\n")
-        data = {}
-
-        for line in lines:
-            if ":" in line:
-                key, value = line.split(":", 1)
-                key = key.strip().lower()
-                data[key] = value.strip()
+        data = {
+            key.strip().lower(): value.strip()
+            for key, value in _AI_FIX_FIELD_RE.findall(section)
+        }
 
         # Extract required fields
         description = data.get("description", "AI-generated fix")
@@ -514,7 +681,8 @@ Be practical and specific. Focus on fixes that can realistically be implemented.
             Unique fix ID
         """
         combined = f"{finding_id}:{template_key}"
-        hash_digest = hashlib.md5(combined.encode()).hexdigest()[:12]
+        # 48-bit BLAKE2b digest: same 12 hex chars as before, stable across runs
+        hash_digest = blake2b(combined.encode(), digest_size=6).hexdigest()
         return f"fix_{hash_digest}"
 
     def _score_to_level(self, score: float) -> ConfidenceLevel:
@@ -527,16 +695,7 @@ Be practical and specific. Focus on fixes that can realistically be implemented.
         Returns:
             ConfidenceLevel
         """
-        if score >= 0.90:
-            return ConfidenceLevel.VERY_HIGH
-        elif score >= 0.75:
-            return ConfidenceLevel.HIGH
-        elif score >= 0.50:
-            return ConfidenceLevel.MEDIUM
-        elif score >= 0.25:
-            return ConfidenceLevel.LOW
-        else:
-            return ConfidenceLevel.VERY_LOW
+        return _SCORE_LEVELS[bisect_right(_SCORE_THRESHOLDS, score)]
 
     def _estimate_effort(self, finding: Finding, strategy: FixStrategy) -> int:
         """
@@ -6,12 +6,17 @@ correlation, false positive filtering, priority scoring, root cause analysis,
 and fix generation.
 """
 
+import asyncio
+import heapq
 import time
 import uuid
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from operator import attrgetter
+from typing import Dict, List, Optional, Tuple
 
+from omniaudit.harmonizer.ai_client import async_anthropic_client, run_coroutine
 from omniaudit.harmonizer.correlator import Correlator
 from omniaudit.harmonizer.deduplicator import Deduplicator
 from omniaudit.harmonizer.false_positive_filter import FalsePositiveFilter
@@ -19,11 +24,13 @@ from omniaudit.harmonizer.fix_generator import FixGenerator
 from omniaudit.harmonizer.priority_scorer import PriorityScorer
 from omniaudit.harmonizer.root_cause_analyzer import RootCauseAnalyzer
 from omniaudit.harmonizer.types import (
+    AutoFix,
     Finding,
     HarmonizationConfig,
     HarmonizationResult,
     HarmonizationStats,
     HarmonizedFinding,
+    RootCauseInfo,
 )
 
 
@@ -55,18 +62,53 @@ class Harmonizer:
         self.false_positive_filter = FalsePositiveFilter(self.config.false_positive)
         self.priority_scorer = PriorityScorer(self.config.priority)
         self.root_cause_analyzer = RootCauseAnalyzer(
-            self.config.root_cause, self.config.anthropic_api_key
+            self.config.root_cause,
+            self.config.anthropic_api_key,
+            enable_cache=self.config.enable_cache,
+            cache_ttl_seconds=self.config.cache_ttl_seconds,
         )
         self.fix_generator = FixGenerator(
             self.config.fix_generation, self.config.anthropic_api_key
         )
 
-    def harmonize(self, findings: List[Finding]) -> HarmonizationResult:
+    def harmonize(
+        self, findings: List[Finding], top_k: Optional[int] = None
+    ) -> HarmonizationResult:
         """
         Harmonize a list of findings.
 
         Args:
             findings: Raw findings from analyzers
+            top_k: Only keep the top_k highest-priority findings in the result
+                (statistics still cover all findings)
+
+        Returns:
+            HarmonizationResult with harmonized findings and statistics
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run_coroutine(self.harmonize_async(findings, top_k))
+
+        # asyncio.run() can't nest inside a running loop, so drive the
+        # pipeline from a worker thread with its own loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(run_coroutine, self.harmonize_async(findings, top_k)).result()
+
+    async def harmonize_async(
+        self, findings: List[Finding], top_k: Optional[int] = None
+    ) -> HarmonizationResult:
+        """
+        Harmonize a list of findings without blocking the event loop.
+
+        CPU-bound stages run in worker threads and AI requests are awaited on
+        the running loop. Priority scoring runs alongside the correlation ->
+        root cause -> fix generation chain, since it depends on none of them.
+
+        Args:
+            findings: Raw findings from analyzers
+            top_k: Only keep the top_k highest-priority findings in the result
+                (statistics still cover all findings)
 
         Returns:
             HarmonizationResult with harmonized findings and statistics
@@ -78,62 +120,53 @@ class Harmonizer:
         # Track original count
         original_count = len(findings)
 
-        # Stage 1: Deduplication
-        try:
-            unique_findings, duplicate_map = self.deduplicator.deduplicate(findings)
-            duplicates_removed = original_count - len(unique_findings)
-        except Exception as e:
-            errors.append(f"Deduplication error: {str(e)}")
-            unique_findings = findings
-            duplicate_map = {}
-            duplicates_removed = 0
-
-        # Stage 2: False Positive Filtering
-        try:
-            valid_findings, false_positives = self.false_positive_filter.filter(unique_findings)
-            false_positives_count = len(false_positives)
-        except Exception as e:
-            errors.append(f"False positive filtering error: {str(e)}")
-            valid_findings = unique_findings
-            false_positives_count = 0
-
-        # Stage 3: Correlation
-        try:
-            correlations = self.correlator.correlate(valid_findings)
-            findings_correlated = sum(1 for corr in correlations.values() if corr)
-        except Exception as e:
-            errors.append(f"Correlation error: {str(e)}")
-            correlations = {}
-            findings_correlated = 0
-
-        # Stage 4: Priority Scoring
-        try:
-            priority_scores = self.priority_scorer.score_findings(valid_findings)
-        except Exception as e:
-            errors.append(f"Priority scoring error: {str(e)}")
-            priority_scores = {}
+        # The CPU-bound stages get their own two threads (one per concurrent
+        # branch of stages 3-6) rather than competing for the host loop's
+        # default executor
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="harmonizer") as executor:
+            # Stage 1: Deduplication
+            try:
+                unique_findings, duplicate_map = await loop.run_in_executor(
+                    executor, self.deduplicator.deduplicate, findings
+                )
+                duplicates_removed = original_count - len(unique_findings)
+            except Exception as e:
+                errors.append(f"Deduplication error: {str(e)}")
+                unique_findings = findings
+                duplicate_map = {}
+                duplicates_removed = 0
+
+            # Stage 2: False Positive Filtering
+            try:
+                valid_findings, false_positives = await loop.run_in_executor(
+                    executor, self.false_positive_filter.filter, unique_findings
+                )
+                false_positives_count = len(false_positives)
+            except Exception as e:
+                errors.append(f"False positive filtering error: {str(e)}")
+                valid_findings = unique_findings
+                false_positives_count = 0
+
+            # Stages 3-6: Correlation, Priority Scoring, Root Cause Analysis
+            # and Fix Generation, with Stage 4 running concurrently with the rest
+            (priority_scores, priority_error), (
+                (correlations, correlation_error),
+                (root_causes, root_cause_error),
+                (all_fixes, fix_error),
+            ) = await asyncio.gather(
+                loop.run_in_executor(executor, self._score_priorities, valid_findings),
+                self._run_dependent_stages(valid_findings, executor),
+            )
 
-        # Stage 5: Root Cause Analysis
-        try:
-            root_causes = self.root_cause_analyzer.analyze_batch(valid_findings, correlations)
-            root_causes_count = sum(1 for rc in root_causes.values() if rc)
-        except Exception as e:
-            errors.append(f"Root cause analysis error: {str(e)}")
-            root_causes = {}
-            root_causes_count = 0
+        # Report errors in stage order
+        for error in (correlation_error, priority_error, root_cause_error, fix_error):
+            if error:
+                errors.append(error)
 
-        # Stage 6: Fix Generation
-        auto_fixes_count = 0
-        all_fixes = {}
-        try:
-            for finding in valid_findings:
-                root_cause = root_causes.get(finding.id)
-                fixes = self.fix_generator.generate_fixes(finding, root_cause)
-                if fixes:
-                    all_fixes[finding.id] = fixes
-                    auto_fixes_count += len(fixes)
-        except Exception as e:
-            errors.append(f"Fix generation error: {str(e)}")
+        findings_correlated = sum(1 for corr in correlations.values() if corr)
+        root_causes_count = sum(1 for rc in root_causes.values() if rc)
+        auto_fixes_count = sum(len(fixes) for fixes in all_fixes.values())
 
         # Stage 7: Build harmonized findings
         harmonized = self._build_harmonized_findings(
@@ -144,6 +177,7 @@ class Harmonizer:
             root_causes,
             all_fixes,
         )
+        ranked = self._rank_findings(harmonized, top_k)
 
         # Calculate statistics
         processing_time = time.time() - start_time
@@ -159,13 +193,98 @@ class Harmonizer:
         )
 
         return HarmonizationResult(
-            findings=harmonized,
+            findings=ranked,
             stats=stats,
             config_used=self.config,
             errors=errors,
             warnings=warnings,
         )
 
+    async def _run_dependent_stages(
+        self, findings: List[Finding], executor: ThreadPoolExecutor
+    ) -> Tuple[
+        Tuple[Dict[str, List[str]], Optional[str]],
+        Tuple[Dict[str, Optional[RootCauseInfo]], Optional[str]],
+        Tuple[Dict[str, List[AutoFix]], Optional[str]],
+    ]:
+        """
+        Run correlation, root cause analysis and fix generation in order.
+
+        Each stage needs the previous one's output. Correlation is CPU-bound
+        and runs in a worker thread; root cause analysis and fix generation
+        await their AI requests on the running loop.
+
+        Args:
+            findings: Valid findings
+            executor: Executor for the blocking stages
+
+        Returns:
+            (result, error) pairs for the three stages
+        """
+        loop = asyncio.get_running_loop()
+        correlation = await loop.run_in_executor(executor, self._correlate, findings)
+
+        # Both AI stages share one async client, closed once they finish
+        use_ai = self.config.root_cause.use_ai or self.config.fix_generation.use_ai
+        async with async_anthropic_client(self.config.anthropic_api_key if use_ai else None):
+            root_cause = await self._analyze_root_causes(findings, correlation[0])
+            fixes = await self._generate_fixes(findings, root_cause[0])
+        return correlation, root_cause, fixes
+
+    def _correlate(
+        self, findings: List[Finding]
+    ) -> Tuple[Dict[str, List[str]], Optional[str]]:
+        """Stage 3: Correlation. Returns (correlations, error)."""
+        try:
+            return self.correlator.correlate(findings), None
+        except Exception as e:
+            return {}, f"Correlation error: {str(e)}"
+
+    def _score_priorities(
+        self, findings: List[Finding]
+    ) -> Tuple[Dict[str, tuple], Optional[str]]:
+        """Stage 4: Priority Scoring. Returns (priority_scores, error)."""
+        try:
+            return self.priority_scorer.score_findings(findings), None
+        except Exception as e:
+            return {}, f"Priority scoring error: {str(e)}"
+
+    async def _analyze_root_causes(
+        self, findings: List[Finding], correlations: Dict[str, List[str]]
+    ) -> Tuple[Dict[str, Optional[RootCauseInfo]], Optional[str]]:
+        """Stage 5: Root Cause Analysis. Returns (root_causes, error)."""
+        try:
+            return await self.root_cause_analyzer.analyze_batch_async(findings, correlations), None
+        except Exception as e:
+            return {}, f"Root cause analysis error: {str(e)}"
+
+    async def _generate_fixes(
+        self, findings: List[Finding], root_causes: Dict[str, Optional[RootCauseInfo]]
+    ) -> Tuple[Dict[str, List[AutoFix]], Optional[str]]:
+        """
+        Stage 6: Fix Generation.
+
+        Fixes for all findings are generated in one batch, with AI requests
+        dispatched concurrently by the fix generator.
+
+        Args:
+            findings: Valid findings
+            root_causes: Root cause analysis
+
+        Returns:
+            Tuple of (fixes by finding ID, error)
+        """
+        all_fixes = {}
+        try:
+            pairs = [(finding, root_causes.get(finding.id)) for finding in findings]
+            batch = await self.fix_generator.generate_fixes_batch(pairs)
+            for finding, fixes in zip(findings, batch):
+                if fixes:
+                    all_fixes[finding.id] = fixes
+        except Exception as e:
+            return all_fixes, f"Fix generation error: {str(e)}"
+        return all_fixes, None
+
     def _build_harmonized_findings(
         self,
         findings: List[Finding],
@@ -191,8 +310,16 @@ class Harmonizer:
         """
         harmonized = []
 
-        # Build finding lookup
-        finding_map = {f.id: f for f in findings}
+        # Build finding lookup, only needed to resolve correlated findings
+        if any(correlations.values()):
+            finding_map = {f.id: f for f in findings}
+        else:
+            finding_map = {}
+
+        # Reverse the duplicate map once: primary ID -> IDs merged into it
+        primary_to_dups: Dict[str, List[str]] = {}
+        for dup_id, primary_id in duplicate_map.items():
+            primary_to_dups.setdefault(primary_id, []).append(dup_id)
 
         for finding in findings:
             # Get data for this finding
@@ -201,17 +328,11 @@ class Harmonizer:
             root_cause = root_causes.get(finding.id)
             fixes = all_fixes.get(finding.id, [])
 
-            # Check if this finding is a duplicate
-            is_duplicate = finding.id in duplicate_map.values()
+            # Check if this finding had duplicates merged into it
+            merged_ids = primary_to_dups.get(finding.id, ())
+            is_duplicate = bool(merged_ids)
             duplicate_of = None
-            duplicate_count = 1
-
-            if is_duplicate:
-                # Find the primary finding
-                for dup_id, primary_id in duplicate_map.items():
-                    if primary_id == finding.id:
-                        duplicate_count += 1
-                        break
+            duplicate_count = 1 + len(merged_ids)
 
             # Extract priority data
             if score_data:
@@ -223,11 +344,12 @@ class Harmonizer:
 
             # Build affected files list
             affected_files = [finding.file_path]
+            seen_files = {finding.file_path}
             for corr_id in correlated_ids[:5]:  # Limit to 5
-                if corr_id in finding_map:
-                    corr_finding = finding_map[corr_id]
-                    if corr_finding.file_path not in affected_files:
-                        affected_files.append(corr_finding.file_path)
+                corr_finding = finding_map.get(corr_id)
+                if corr_finding is not None and corr_finding.file_path not in seen_files:
+                    seen_files.add(corr_finding.file_path)
+                    affected_files.append(corr_finding.file_path)
 
             # Create harmonized finding
             harmonized_finding = HarmonizedFinding(
@@ -237,6 +359,7 @@ class Harmonizer:
                 affected_files=affected_files,
                 line_number=finding.line_number,
                 severity=finding.severity,
+                rule_id=finding.rule_id,
                 category=finding.category,
                 message=finding.message,
                 priority_score=priority_score,
@@ -263,11 +386,27 @@ class Harmonizer:
 
             harmonized.append(harmonized_finding)
 
-        # Sort by priority score (descending)
-        harmonized.sort(key=lambda f: f.priority_score, reverse=True)
-
         return harmonized
 
+    def _rank_findings(
+        self, harmonized: List[HarmonizedFinding], top_k: Optional[int] = None
+    ) -> List[HarmonizedFinding]:
+        """
+        Order harmonized findings by priority score (descending).
+
+        Args:
+            harmonized: Harmonized findings
+            top_k: Only return the top_k findings; a partial selection is
+                cheaper than sorting everything
+
+        Returns:
+            Findings in priority order, ties keeping their original order
+        """
+        priority = attrgetter("priority_score")
+        if top_k is None:
+            return sorted(harmonized, key=priority, reverse=True)
+        return heapq.nlargest(top_k, harmonized, key=priority)
+
     def _build_stats(
         self,
         original_count: int,
@@ -295,16 +434,12 @@ class Harmonizer:
         Returns:
             HarmonizationStats
         """
-        # Count by severity
-        by_severity = Counter(f.severity.value for f in harmonized)
-
-        # Count by category
-        by_category = Counter(f.category for f in harmonized)
-
-        # Count by impact
-        by_impact = Counter(
-            f.impact_level.value for f in harmonized if f.impact_level
-        )
+        # Count raw field values with Counter's C loop; severity and impact
+        # have only a handful of members, so converting them to their string
+        # values afterwards is cheaper than per finding
+        by_severity = Counter([f.severity for f in harmonized])
+        by_category = Counter([f.category for f in harmonized])
+        by_impact = Counter([f.impact_level for f in harmonized if f.impact_level is not None])
 
         return HarmonizationStats(
             total_findings=original_count,
@@ -315,9 +450,9 @@ class Harmonizer:
             auto_fixes_generated=auto_fixes_count,
             root_causes_identified=root_causes_count,
             processing_time_seconds=processing_time,
-            by_severity=dict(by_severity),
+            by_severity={severity.value: count for severity, count in by_severity.items()},
             by_category=dict(by_category),
-            by_impact=dict(by_impact),
+            by_impact={impact.value: count for impact, count in by_impact.items()},
         )
 
     def harmonize_incremental(
@@ -333,6 +468,38 @@ class Harmonizer:
         Returns:
             Updated HarmonizationResult
         """
+        start_time = time.time()
+
+        # A re-report identical to a previous finding adds nothing, so drop
+        # it up front. Severity and rule ID count towards identity: a
+        # re-report that changes them is kept and, coming first, becomes the
+        # primary when deduplicated. When nothing new remains, the previous
+        # findings are still current.
+        if self.config.deduplication.enabled:
+            known = {
+                (hf.file_path, hf.line_number, hf.category, hf.message, hf.severity, hf.rule_id)
+                for hf in previous_result.findings
+            }
+            new_findings = [
+                f
+                for f in new_findings
+                if (f.file_path, f.line_number, f.category, f.message, f.severity, f.rule_id)
+                not in known
+            ]
+            if not new_findings:
+                stats = previous_result.stats.model_copy(
+                    update={"processing_time_seconds": time.time() - start_time}
+                )
+                return previous_result.model_copy(
+                    update={
+                        "findings": list(previous_result.findings),
+                        "stats": stats,
+                        "timestamp": datetime.utcnow().isoformat() + "Z",
+                        "errors": list(previous_result.errors),
+                        "warnings": list(previous_result.warnings),
+                    }
+                )
+
         # Convert previous harmonized findings back to Finding objects
         previous_findings = []
         for hf in previous_result.findings:
@@ -342,6 +509,7 @@ class Harmonizer:
                 file_path=hf.file_path,
                 line_number=hf.line_number,
                 severity=hf.severity,
+                rule_id=hf.rule_id,
                 category=hf.category,
                 message=hf.message,
                 analyzer_name=hf.analyzers[0] if hf.analyzers else "unknown",
@@ -435,6 +603,22 @@ class Harmonizer:
                 }
                 for f in result.findings[:10]
             ],
-            "errors": result.errors,
-            "warnings": result.warnings,
+            "errors": list(result.errors),
+            "warnings": list(result.warnings),
         }
+
+    def export_json(self, result: HarmonizationResult, indent: Optional[int] = None) -> str:
+        """
+        Export full harmonization results as JSON.
+
+        Serializes straight from the models with pydantic-core rather than
+        building an intermediate dict and passing it to ``json.dumps``.
+
+        Args:
+            result: Harmonization result
+            indent: Optional indentation for pretty-printed output
+
+        Returns:
+            JSON string
+        """
+        return result.model_dump_json(indent=indent)
@@ -0,0 +1,11 @@
+"""
+Shared regex helpers for the Harmonization Engine.
+"""
+
+import re
+from typing import List
+
+
+def keyword_regex(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one alternation so a text is scanned once for all of them."""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
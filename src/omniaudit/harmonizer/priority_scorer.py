@@ -5,14 +5,45 @@ This module assigns priority scores to findings based on multiple factors includ
 severity, frequency, business impact, and issue age.
 """
 
+import math
 import os
+from bisect import bisect_left, bisect_right
 from collections import Counter
-from datetime import datetime
-from typing import Dict, List
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional
 
+from omniaudit.harmonizer.patterns import keyword_regex
 from omniaudit.harmonizer.types import Finding, ImpactLevel, PriorityConfig, Severity
 
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO 8601 finding timestamp; findings from one scan share a few values."""
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+# Age buckets: ages up to each bound (in days) score the matching entry,
+# older issues score the last one
+_AGE_BOUNDS = (7, 30, 90)
+_AGE_SCORES = (100.0, 80.0, 60.0, 40.0)
+
+# Path keyword groups for the impact score
+_AUTH_PATH = keyword_regex(["auth", "login", "password", "token", "session"])
+_API_PATH = keyword_regex(["api", "service", "controller", "route"])
+_DATABASE_PATH = keyword_regex(["db", "database", "model", "migration"])
+_CORE_PATH = keyword_regex(["core", "util", "lib", "shared"])
+_TEST_PATH = keyword_regex(["test", "spec", "mock"])
+_DOC_PATH = keyword_regex([".md", "readme", "doc"])
+
+# Path keyword groups for the business impact assessment
+_PAYMENT_AREA = keyword_regex(["payment", "billing", "checkout", "transaction"])
+_AUTH_AREA = keyword_regex(["auth", "login", "security"])
+_API_AREA = keyword_regex(["api", "service"])
+_UI_AREA = keyword_regex(["ui", "view", "component"])
+_TEST_AREA = keyword_regex(["test", "spec"])
+
+
 class PriorityScorer:
     """
     Scores findings based on multiple factors to determine remediation priority.
@@ -42,19 +73,33 @@ class PriorityScorer:
         (0, 20): ImpactLevel.NEGLIGIBLE,
     }
 
+    # IMPACT_LEVELS as ascending band lower bounds (the first band starts at 0)
+    # and their levels, for bisect lookups
+    _IMPACT_BOUNDS = tuple(low for (low, _), _ in sorted(IMPACT_LEVELS.items())[1:])
+    _IMPACT_LEVELS_ORDERED = tuple(level for _, level in sorted(IMPACT_LEVELS.items()))
+
     def __init__(self, config: PriorityConfig):
         """Initialize priority scorer with configuration."""
         self.config = config
-        self._validate_weights()
-
-    def _validate_weights(self) -> None:
-        """Ensure weights sum to approximately 1.0."""
-        total = (
-            self.config.severity_weight
-            + self.config.frequency_weight
-            + self.config.impact_weight
-            + self.config.age_weight
+        # (severity, frequency, impact, age) weights, read once per score
+        self._weights = self._validate_weights()
+
+    def _validate_weights(self) -> tuple[float, float, float, float]:
+        """
+        Ensure weights sum to approximately 1.0.
+
+        Weights within tolerance are renormalized so they sum to exactly 1.0.
+
+        Returns:
+            (severity, frequency, impact, age) weights summing to 1.0
+        """
+        weights = (
+            self.config.severity_weight,
+            self.config.frequency_weight,
+            self.config.impact_weight,
+            self.config.age_weight,
         )
+        total = sum(weights)
 
         # Allow small tolerance for floating point
         if abs(total - 1.0) > 0.01:
@@ -63,6 +108,11 @@ class PriorityScorer:
                 f"Adjust severity_weight, frequency_weight, impact_weight, and age_weight."
             )
 
+        if total == 1.0:
+            return weights
+        severity, frequency, impact, age = weights
+        return (severity / total, frequency / total, impact / total, age / total)
+
     def score_findings(
         self, findings: List[Finding]
     ) -> Dict[str, tuple[float, ImpactLevel, str]]:
@@ -82,16 +132,51 @@ class PriorityScorer:
         rule_frequency = self._calculate_frequency(findings, "rule_id")
         category_frequency = self._calculate_frequency(findings, "category")
 
+        # Age every finding against the same clock reading
+        now = datetime.now(timezone.utc)
+
+        # Frequency and location components only depend on a few fields that
+        # repeat across findings, so each is computed once per distinct key
+        frequency_scores: Dict[tuple, float] = {}
+        impact_scores: Dict[tuple, float] = {}
+        business_impacts: Dict[tuple, str] = {}
+        age_scores: Dict[str, float] = {}
+
+        # Severity is a str-backed enum, so this lookup hashes in C; bind it once
+        severity_score_of = self.SEVERITY_SCORES.get
+
         scores = {}
         for finding in findings:
-            priority_score = self._calculate_priority_score(
-                finding, rule_frequency, category_frequency
+            frequency_key = (finding.rule_id, finding.category)
+            frequency_score = frequency_scores.get(frequency_key)
+            if frequency_score is None:
+                frequency_score = frequency_scores[frequency_key] = (
+                    self._calculate_frequency_score(finding, rule_frequency, category_frequency)
+                )
+
+            location_key = (finding.file_path, finding.category)
+            impact_score = impact_scores.get(location_key)
+            if impact_score is None:
+                # Lowercase the path once for both location checks
+                path_lower = finding.file_path.lower()
+                impact_score = impact_scores[location_key] = self._calculate_impact_score(
+                    finding, path_lower
+                )
+                business_impacts[location_key] = self._assess_business_impact(finding, path_lower)
+
+            age_score = age_scores.get(finding.timestamp)
+            if age_score is None:
+                age_score = age_scores[finding.timestamp] = self._calculate_age_score(finding, now)
+
+            priority_score = self._combine_scores(
+                severity_score_of(finding.severity, 50.0),
+                frequency_score,
+                impact_score,
+                age_score,
             )
 
             impact_level = self._get_impact_level(priority_score)
-            business_impact = self._assess_business_impact(finding)
-
-            scores[finding.id] = (priority_score, impact_level, business_impact)
+            scores[finding.id] = (priority_score, impact_level, business_impacts[location_key])
 
         return scores
 
@@ -142,12 +227,34 @@ class PriorityScorer:
         # Component 4: Age score (penalize very old or very new issues differently)
         age_score = self._calculate_age_score(finding)
 
+        return self._combine_scores(severity_score, frequency_score, impact_score, age_score)
+
+    def _combine_scores(
+        self,
+        severity_score: float,
+        frequency_score: float,
+        impact_score: float,
+        age_score: float,
+    ) -> float:
+        """
+        Combine component scores into a priority score.
+
+        Args:
+            severity_score: Severity component (0-100)
+            frequency_score: Frequency component
+            impact_score: Business impact component (0-100)
+            age_score: Age component (0-100)
+
+        Returns:
+            Priority score (0-100)
+        """
         # Weighted combination
+        severity_weight, frequency_weight, impact_weight, age_weight = self._weights
         total_score = (
-            severity_score * self.config.severity_weight
-            + frequency_score * self.config.frequency_weight
-            + impact_score * self.config.impact_weight
-            + age_score * self.config.age_weight
+            severity_score * severity_weight
+            + frequency_score * frequency_weight
+            + impact_score * impact_weight
+            + age_score * age_weight
         )
 
         # Ensure score is in 0-100 range
@@ -197,8 +304,6 @@ class PriorityScorer:
 
         # Calculate score based on frequency
         # Use logarithmic scale to avoid extreme values
-        import math
-
         # Rule frequency (more weight)
         rule_score = min(100.0, 30.0 * math.log10(rule_count + 1))
 
@@ -207,12 +312,13 @@ class PriorityScorer:
 
         return rule_score + category_score
 
-    def _calculate_impact_score(self, finding: Finding) -> float:
+    def _calculate_impact_score(self, finding: Finding, file_path: Optional[str] = None) -> float:
         """
         Calculate business impact score based on file location.
 
         Args:
             finding: Finding to score
+            file_path: Lowercased file path, if already computed
 
         Returns:
             Impact score (0-100)
@@ -220,7 +326,8 @@ class PriorityScorer:
         score = 50.0  # Default medium impact
 
         # Check if file is in business-critical paths
-        file_path = finding.file_path.lower()
+        if file_path is None:
+            file_path = finding.file_path.lower()
 
         for critical_path in self.config.business_critical_paths:
             if critical_path.lower() in file_path:
@@ -230,35 +337,32 @@ class PriorityScorer:
         # Heuristic-based impact assessment
         # Security issues in authentication/authorization code
         if finding.category in ["security", "vulnerability"]:
-            if any(
-                keyword in file_path
-                for keyword in ["auth", "login", "password", "token", "session"]
-            ):
+            if _AUTH_PATH.search(file_path):
                 score = max(score, 95.0)
 
         # Issues in API/service layer
-        if any(keyword in file_path for keyword in ["api", "service", "controller", "route"]):
+        if _API_PATH.search(file_path):
             score = max(score, 80.0)
 
         # Issues in database layer
-        if any(keyword in file_path for keyword in ["db", "database", "model", "migration"]):
+        if _DATABASE_PATH.search(file_path):
             score = max(score, 75.0)
 
         # Issues in core/util code (high reuse)
-        if any(keyword in file_path for keyword in ["core", "util", "lib", "shared"]):
+        if _CORE_PATH.search(file_path):
             score = max(score, 70.0)
 
         # Issues in tests are lower priority
-        if any(keyword in file_path for keyword in ["test", "spec", "mock"]):
+        if _TEST_PATH.search(file_path):
             score = min(score, 30.0)
 
         # Issues in documentation are lowest priority
-        if any(keyword in file_path for keyword in [".md", "readme", "doc"]):
+        if _DOC_PATH.search(file_path):
             score = min(score, 20.0)
 
         return score
 
-    def _calculate_age_score(self, finding: Finding) -> float:
+    def _calculate_age_score(self, finding: Finding, now: Optional[datetime] = None) -> float:
         """
         Calculate age-based score.
 
@@ -267,14 +371,19 @@ class PriorityScorer:
 
         Args:
             finding: Finding to score
+            now: Current time as an aware UTC datetime (read from the clock if omitted)
 
         Returns:
             Age score (0-100)
         """
         try:
             # Parse timestamp
-            timestamp = datetime.fromisoformat(finding.timestamp.replace("Z", "+00:00"))
-            now = datetime.now(timestamp.tzinfo)
+            timestamp = _parse_timestamp(finding.timestamp)
+            if now is None:
+                now = datetime.now(timezone.utc)
+            if timestamp.tzinfo is None:
+                # Naive timestamps are compared against local wall-clock time
+                now = now.astimezone().replace(tzinfo=None)
 
             # Calculate age in days
             age_days = (now - timestamp).total_seconds() / (24 * 3600)
@@ -284,15 +393,7 @@ class PriorityScorer:
             # - 7-30 days: 80 (recent, high priority)
             # - 30-90 days: 60 (medium age, medium priority)
             # - 90+ days: 40 (old, may be accepted risk)
-
-            if age_days <= 7:
-                return 100.0
-            elif age_days <= 30:
-                return 80.0
-            elif age_days <= 90:
-                return 60.0
-            else:
-                return 40.0
+            return _AGE_SCORES[bisect_left(_AGE_BOUNDS, age_days)]
 
         except (ValueError, AttributeError):
             # If timestamp is invalid or missing, assume medium priority
@@ -308,42 +409,36 @@ class PriorityScorer:
         Returns:
             ImpactLevel enum
         """
-        for (min_score, max_score), level in self.IMPACT_LEVELS.items():
-            if min_score <= priority_score < max_score:
-                return level
-
-        # Fallback
-        return ImpactLevel.MEDIUM
+        return self._IMPACT_LEVELS_ORDERED[bisect_right(self._IMPACT_BOUNDS, priority_score)]
 
-    def _assess_business_impact(self, finding: Finding) -> str:
+    def _assess_business_impact(self, finding: Finding, file_path: Optional[str] = None) -> str:
         """
         Generate business impact assessment text.
 
         Args:
             finding: Finding to assess
+            file_path: Lowercased file path, if already computed
 
         Returns:
             Business impact description
         """
-        file_path = finding.file_path.lower()
+        if file_path is None:
+            file_path = finding.file_path.lower()
 
         # Critical business areas
-        if any(
-            keyword in file_path
-            for keyword in ["payment", "billing", "checkout", "transaction"]
-        ):
+        if _PAYMENT_AREA.search(file_path):
             return "Critical: Affects payment/transaction processing"
 
-        if any(keyword in file_path for keyword in ["auth", "login", "security"]):
+        if _AUTH_AREA.search(file_path):
             return "High: Affects authentication/authorization"
 
-        if any(keyword in file_path for keyword in ["api", "service"]):
+        if _API_AREA.search(file_path):
             return "Medium: Affects API/service functionality"
 
-        if any(keyword in file_path for keyword in ["ui", "view", "component"]):
+        if _UI_AREA.search(file_path):
             return "Medium: Affects user interface"
 
-        if any(keyword in file_path for keyword in ["test", "spec"]):
+        if _TEST_AREA.search(file_path):
             return "Low: Affects test code only"
 
         # Default
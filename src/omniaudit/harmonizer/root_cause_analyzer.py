@@ -5,18 +5,93 @@ This module identifies root causes of findings using AI-powered analysis
 and heuristic-based pattern recognition.
 """
 
-import os
-from typing import List, Optional
+import asyncio
+import re
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
+
+from omniaudit.harmonizer.ai_client import (
+    ANTHROPIC_AVAILABLE,
+    async_anthropic_client,
+    get_anthropic_client,
+    get_async_anthropic_client,
+    run_coroutine,
+)
+from omniaudit.harmonizer.types import Finding, RootCauseConfig, RootCauseInfo, Severity
+
+if TYPE_CHECKING:
+    from anthropic import Anthropic, AsyncAnthropic
+
+# Severities that mark a heuristic root cause as systemic
+_HIGH_SEVERITIES = frozenset({Severity.CRITICAL, Severity.HIGH})
+
+# Numbers, hex literals and quoted strings vary between otherwise identical
+# findings, so they are masked out of AI cache keys
+_VOLATILE_TOKEN_RE = re.compile(r'0x[0-9a-f]+|\d+|"[^"]*"')
+_WORD_RE = re.compile(r"\w{2,}")
+
+# AI responses hold "KEY: value" lines; batched responses open each
+# finding's block with a "FINDING <n>" line, possibly decorated as in
+# "**FINDING 3**", and close it with a "---" line
+_AI_FIELD_RE = re.compile(r"^([^:\n]*):(.*)$", re.MULTILINE)
+_AI_BATCH_SPLIT_RE = re.compile(
+    r"^(?:[^\w\n]*FINDING[ \t]*#?[ \t]*(\d+)[^\w\n]*|[ \t]*---+[ \t]*)$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_AI_FIELDS = frozenset(
+    {"root_cause", "contributing_factors", "evidence", "confidence", "related_patterns"}
+)
+# First number in a confidence value such as "0.85 (high)"
+_AI_CONFIDENCE_RE = re.compile(r"\d*\.?\d+")
+# Last field of each response block; once its line is complete the rest of
+# a streamed response is not needed
+_AI_LAST_FIELD = "RELATED_PATTERNS:"
+
+# AI prompt sections; prompts are assembled from these with one join
+_AI_FINDING_DETAILS = """**Finding Details:**
+- Category: {category}
+- Severity: {severity}
+- File: {file_path}
+- Line: {line}
+- Message: {message}
+- Rule ID: {rule_id}
+"""
 
-from omniaudit.harmonizer.types import Finding, RootCauseConfig, RootCauseInfo
+_AI_TASK = """
+**Task:**
+Identify the root cause of this issue. Consider:
+1. Is this a symptom of a deeper problem?
+2. What underlying issue caused this?
+3. Are there related patterns in the codebase?
 
-# Try to import Anthropic SDK
-try:
-    from anthropic import Anthropic
+Respond in this format:
+ROOT_CAUSE: [One sentence describing the root cause]
+CONTRIBUTING_FACTORS: [Comma-separated list of contributing factors]
+EVIDENCE: [Key evidence supporting this root cause]
+CONFIDENCE: [0.0-1.0 confidence score]
+RELATED_PATTERNS: [Common patterns that might exist elsewhere]
+"""
 
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+_AI_BATCH_TASK = """
+**Task:**
+Identify the root cause of each issue. Consider:
+1. Is this a symptom of a deeper problem?
+2. What underlying issue caused this?
+3. Are there related patterns in the codebase?
+
+Respond with one block per finding, in order, separated by lines containing only ---:
+FINDING [Finding number]
+ROOT_CAUSE: [One sentence describing the root cause]
+CONTRIBUTING_FACTORS: [Comma-separated list of contributing factors]
+EVIDENCE: [Key evidence supporting this root cause]
+CONFIDENCE: [0.0-1.0 confidence score]
+RELATED_PATTERNS: [Common patterns that might exist elsewhere]
+---
+"""
 
 
 class RootCauseAnalyzer:
@@ -28,72 +103,116 @@ class RootCauseAnalyzer:
     """
 
     # Heuristic patterns for common root causes
-    ROOT_CAUSE_PATTERNS = {
-        "lack_of_input_validation": [
-            "injection",
-            "xss",
-            "sql injection",
-            "command injection",
-            "path traversal",
-        ],
-        "insufficient_error_handling": [
-            "unhandled exception",
-            "error not caught",
-            "missing try-catch",
-            "unchecked error",
-        ],
-        "insecure_configuration": [
-            "hardcoded",
-            "default password",
-            "exposed credentials",
-            "insecure default",
-        ],
-        "poor_code_organization": [
-            "high complexity",
-            "too many lines",
-            "god object",
-            "long method",
-            "duplicate code",
-        ],
-        "missing_tests": [
-            "no tests",
-            "untested",
-            "low coverage",
-            "missing test case",
-        ],
-        "dependency_issues": [
-            "vulnerable dependency",
-            "outdated package",
-            "deprecated",
-            "unmaintained",
-        ],
-        "race_condition": [
-            "thread safety",
-            "concurrent access",
-            "synchronization",
-            "atomic operation",
-        ],
-        "memory_management": [
-            "memory leak",
-            "buffer overflow",
-            "dangling pointer",
-            "resource leak",
-        ],
-    }
-
-    def __init__(self, config: RootCauseConfig, anthropic_api_key: Optional[str] = None):
+    ROOT_CAUSE_PATTERNS = MappingProxyType(
+        {
+            "lack_of_input_validation": (
+                "injection",
+                "xss",
+                "sql injection",
+                "command injection",
+                "path traversal",
+            ),
+            "insufficient_error_handling": (
+                "unhandled exception",
+                "error not caught",
+                "missing try-catch",
+                "unchecked error",
+            ),
+            "insecure_configuration": (
+                "hardcoded",
+                "default password",
+                "exposed credentials",
+                "insecure default",
+            ),
+            "poor_code_organization": (
+                "high complexity",
+                "too many lines",
+                "god object",
+                "long method",
+                "duplicate code",
+            ),
+            "missing_tests": (
+                "no tests",
+                "untested",
+                "low coverage",
+                "missing test case",
+            ),
+            "dependency_issues": (
+                "vulnerable dependency",
+                "outdated package",
+                "deprecated",
+                "unmaintained",
+            ),
+            "race_condition": (
+                "thread safety",
+                "concurrent access",
+                "synchronization",
+                "atomic operation",
+            ),
+            "memory_management": (
+                "memory leak",
+                "buffer overflow",
+                "dangling pointer",
+                "resource leak",
+            ),
+        }
+    )
+
+    # Descriptions of each root cause type, built once at import
+    _ROOT_CAUSE_DESCRIPTIONS = MappingProxyType(
+        {
+            "lack_of_input_validation": "Insufficient input validation and sanitization",
+            "insufficient_error_handling": "Inadequate error handling and exception management",
+            "insecure_configuration": "Insecure configuration or hardcoded credentials",
+            "poor_code_organization": "Poor code organization and high complexity",
+            "missing_tests": "Insufficient test coverage",
+            "dependency_issues": "Vulnerable or outdated dependencies",
+            "race_condition": "Potential race condition or concurrency issue",
+            "memory_management": "Memory management or resource leak issue",
+        }
+    )
+
+    def __init__(
+        self,
+        config: RootCauseConfig,
+        anthropic_api_key: Optional[str] = None,
+        enable_cache: bool = True,
+        cache_ttl_seconds: int = 3600,
+    ):
         """
         Initialize root cause analyzer.
 
         Args:
             config: Root cause analysis configuration
             anthropic_api_key: Optional Anthropic API key for AI analysis
+            enable_cache: Reuse AI root causes for findings with the same signature
+            cache_ttl_seconds: How long a cached AI root cause stays valid
         """
         self.config = config
-        self._client: Optional[Anthropic] = None
+        self.enable_cache = enable_cache
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self._ai_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, RootCauseInfo]]" = OrderedDict()
+        # Per category: AI cache key -> message tokens, for similarity lookups
+        self._semantic_index: Dict[str, Dict[Tuple[Any, ...], FrozenSet[str]]] = defaultdict(dict)
+        self._api_key: Optional[str] = None
+        self._client: Optional["Anthropic"] = None
 
         if config.use_ai and ANTHROPIC_AVAILABLE and anthropic_api_key:
-            self._client = Anthropic(api_key=anthropic_api_key)
+            self._api_key = anthropic_api_key
+            self._client = get_anthropic_client(anthropic_api_key)
+
+        # All root cause keywords in one pattern: capture group i + 1 holds
+        # root cause i's keywords. The lookahead reports a match at every
+        # position a keyword starts, so no keyword hides another.
+        self._root_causes = list(self.ROOT_CAUSE_PATTERNS)
+        self._root_cause_re = re.compile(
+            "(?="
+            + "|".join(
+                "(" + "|".join(re.escape(keyword) for keyword in keywords) + ")"
+                for keywords in self.ROOT_CAUSE_PATTERNS.values()
+            )
+            + ")"
+        )
 
     def analyze(
         self, finding: Finding, correlated_findings: Optional[List[Finding]] = None
@@ -111,14 +230,54 @@ class RootCauseAnalyzer:
         if not self.config.enabled:
             return None
 
-        # Try AI analysis first if available
+        # Keyword matches are cheap and usually conclusive, so only ask the
+        # AI when none matched confidently
+        root_cause = self._match_root_cause_pattern(finding, correlated_findings)
+        if self._is_confident(root_cause):
+            return root_cause
+
+        if self.config.use_ai and self._client:
+            ai_root_cause = self._analyze_with_ai(finding, correlated_findings)
+            if self._is_confident(ai_root_cause):
+                return ai_root_cause
+
+        # Fallback to heuristic analysis
+        return root_cause or self._build_generic_root_cause(finding, correlated_findings)
+
+    async def analyze_async(
+        self, finding: Finding, correlated_findings: Optional[List[Finding]] = None
+    ) -> Optional[RootCauseInfo]:
+        """
+        Analyze a finding without blocking the event loop on the AI request.
+
+        Args:
+            finding: Finding to analyze
+            correlated_findings: Optional list of correlated findings
+
+        Returns:
+            RootCauseInfo if root cause identified, None otherwise
+        """
+        if not self.config.enabled:
+            return None
+
+        # Keyword matches are cheap and usually conclusive, so only ask the
+        # AI when none matched confidently
+        root_cause = self._match_root_cause_pattern(finding, correlated_findings)
+        if self._is_confident(root_cause):
+            return root_cause
+
         if self.config.use_ai and self._client:
-            root_cause = self._analyze_with_ai(finding, correlated_findings)
-            if root_cause and root_cause.confidence >= self.config.min_confidence:
-                return root_cause
+            async with async_anthropic_client(self._api_key):
+                ai_root_cause = await self._analyze_with_ai_async(finding, correlated_findings)
+            if self._is_confident(ai_root_cause):
+                return ai_root_cause
 
         # Fallback to heuristic analysis
-        return self._analyze_with_heuristics(finding, correlated_findings)
+        return root_cause or self._build_generic_root_cause(finding, correlated_findings)
+
+    def _is_confident(self, root_cause: Optional[RootCauseInfo]) -> bool:
+        """Check whether a root cause meets the configured minimum confidence."""
+        return root_cause is not None and root_cause.confidence >= self.config.min_confidence
 
     def _analyze_with_ai(
         self, finding: Finding, correlated_findings: Optional[List[Finding]] = None
@@ -136,27 +295,220 @@ class RootCauseAnalyzer:
         if not self._client:
             return None
 
+        cache_key = self._get_cache_key(finding)
+        cached = self._check_cache(cache_key)
+        if cached:
+            return cached
+
         try:
-            # Build prompt
-            prompt = self._build_ai_prompt(finding, correlated_findings)
+            text = ""
+            # Stream so generation can be abandoned once the last field arrives
+            with self._client.messages.stream(
+                **self._build_ai_request(finding, correlated_findings)
+            ) as stream:
+                for chunk in stream.text_stream:
+                    text += chunk
+                    if self._is_ai_response_complete(text):
+                        break
+            root_cause = self._parse_ai_response(text, finding)
+            self._set_cache(cache_key, root_cause)
+            return root_cause
 
-            # Call Anthropic API
-            response = self._client.messages.create(
-                model="claude-sonnet-4-5",
-                max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
-            )
+        except Exception:
+            # Fall back to heuristics on error
+            return None
+
+    async def _analyze_with_ai_async(
+        self, finding: Finding, correlated_findings: Optional[List[Finding]] = None
+    ) -> Optional[RootCauseInfo]:
+        """
+        Use AI to analyze root cause without blocking the event loop.
+
+        Args:
+            finding: Finding to analyze
+            correlated_findings: Correlated findings for context
+
+        Returns:
+            RootCauseInfo if successful, None otherwise
+        """
+        if not self._client:
+            return None
 
-            # Parse response
-            response_text = response.content[0].text
+        cache_key = self._get_cache_key(finding)
+        cached = self._check_cache(cache_key)
+        if cached:
+            return cached
 
-            # Extract root cause from response
-            return self._parse_ai_response(response_text, finding)
+        try:
+            text = ""
+            # Stream so generation can be abandoned once the last field arrives
+            async with self._get_async_client().messages.stream(
+                **self._build_ai_request(finding, correlated_findings)
+            ) as stream:
+                async for chunk in stream.text_stream:
+                    text += chunk
+                    if self._is_ai_response_complete(text):
+                        break
+            root_cause = self._parse_ai_response(text, finding)
+            self._set_cache(cache_key, root_cause)
+            return root_cause
 
         except Exception:
             # Fall back to heuristics on error
             return None
 
+    def _get_cache_key(self, finding: Finding) -> Tuple[Any, ...]:
+        """
+        Generate the AI cache key for a finding.
+
+        Findings that differ only in numbers, hex literals or quoted strings
+        share a key.
+
+        Args:
+            finding: Finding to key
+
+        Returns:
+            Tuple of category, rule ID, normalized message and snippet digest
+        """
+        snippet = finding.code_snippet.encode() if finding.code_snippet else b""
+        return (
+            finding.category,
+            finding.rule_id,
+            _VOLATILE_TOKEN_RE.sub("\u2022", finding.message_lower),
+            blake2b(snippet, digest_size=8).digest(),
+        )
+
+    def _check_cache(self, cache_key: Tuple[Any, ...]) -> Optional[RootCauseInfo]:
+        """
+        Return the cached AI root cause if it exists and is valid.
+
+        With ``config.semantic_cache_enabled``, a miss falls back to the most
+        similarly worded cached finding in the same category.
+
+        Args:
+            cache_key: Key from _get_cache_key
+
+        Returns:
+            Cached RootCauseInfo, or None on a miss
+        """
+        if not self.enable_cache:
+            return None
+
+        root_cause = self._get_cached(cache_key)
+        if root_cause is None and self.config.semantic_cache_enabled:
+            similar_key = self._find_similar_key(cache_key)
+            if similar_key is not None:
+                root_cause = self._get_cached(similar_key)
+
+        return root_cause
+
+    def _get_cached(self, cache_key: Tuple[Any, ...]) -> Optional[RootCauseInfo]:
+        """Return the cached AI root cause for an exact key, dropping it if expired."""
+        cached = self._ai_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        cached_at, root_cause = cached
+        if time.monotonic() - cached_at > self.cache_ttl_seconds:
+            # Cache expired
+            self._evict(cache_key)
+            return None
+
+        self._ai_cache.move_to_end(cache_key)
+        return root_cause
+
+    def _find_similar_key(self, cache_key: Tuple[Any, ...]) -> Optional[Tuple[Any, ...]]:
+        """
+        Find the cached key whose message is most similar to this one.
+
+        Similarity is Jaccard over message word tokens, compared only against
+        findings of the same category.
+
+        Args:
+            cache_key: Key from _get_cache_key
+
+        Returns:
+            Most similar cached key at or above the threshold, None otherwise
+        """
+        tokens = frozenset(_WORD_RE.findall(cache_key[2]))
+        if not tokens:
+            return None
+
+        best_key = None
+        best_similarity = self.config.semantic_cache_threshold
+        for key, cached_tokens in self._semantic_index[cache_key[0]].items():
+            intersection = len(tokens & cached_tokens)
+            similarity = intersection / (len(tokens) + len(cached_tokens) - intersection)
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+
+        return best_key
+
+    def _set_cache(self, cache_key: Tuple[Any, ...], root_cause: Optional[RootCauseInfo]) -> None:
+        """Store an AI root cause in the LRU cache."""
+        if not self.enable_cache or root_cause is None:
+            return
+
+        self._ai_cache[cache_key] = (time.monotonic(), root_cause)
+        self._ai_cache.move_to_end(cache_key)
+        if self.config.semantic_cache_enabled:
+            self._semantic_index[cache_key[0]][cache_key] = frozenset(
+                _WORD_RE.findall(cache_key[2])
+            )
+
+        if len(self._ai_cache) > self.config.ai_cache_max_size:
+            self._evict(next(iter(self._ai_cache)))
+
+    def _evict(self, cache_key: Tuple[Any, ...]) -> None:
+        """Remove a key from the AI cache and the semantic index."""
+        del self._ai_cache[cache_key]
+        self._semantic_index[cache_key[0]].pop(cache_key, None)
+
+    def _is_ai_response_complete(self, text: str, blocks: int = 1) -> bool:
+        """
+        Check whether a streamed AI response holds every field the parser reads.
+
+        Args:
+            text: Response text received so far
+            blocks: Number of response blocks expected (one per finding)
+
+        Returns:
+            True once the last field line of the final block has ended
+        """
+        if text.count(_AI_LAST_FIELD) < blocks:
+            return False
+        return "\n" in text[text.rindex(_AI_LAST_FIELD) :]
+
+    def _get_async_client(self) -> "AsyncAnthropic":
+        """
+        Get the async client opened for this analysis.
+
+        Returns:
+            AsyncAnthropic client shared by every AI stage of the run
+        """
+        return get_async_anthropic_client(self._api_key)
+
+    def _build_ai_request(
+        self, finding: Finding, correlated_findings: Optional[List[Finding]]
+    ) -> Dict[str, Any]:
+        """
+        Build the messages.create arguments for an AI root cause request.
+
+        Args:
+            finding: Finding to analyze
+            correlated_findings: Correlated findings for context
+
+        Returns:
+            Keyword arguments for the Anthropic client
+        """
+        return {
+            "model": "claude-sonnet-4-5",
+            "max_tokens": 1024,
+            "messages": [
+                {"role": "user", "content": self._build_ai_prompt(finding, correlated_findings)}
+            ],
+        }
+
     def _build_ai_prompt(
         self, finding: Finding, correlated_findings: Optional[List[Finding]] = None
     ) -> str:
@@ -170,41 +522,95 @@ class RootCauseAnalyzer:
         Returns:
             Prompt string
         """
-        prompt = f"""Analyze this code quality finding to identify its root cause.
+        return "".join(
+            (
+                "Analyze this code quality finding to identify its root cause.\n\n",
+                self._build_finding_details(finding, correlated_findings),
+                _AI_TASK,
+            )
+        )
 
-**Finding Details:**
-- Category: {finding.category}
-- Severity: {finding.severity}
-- File: {finding.file_path}
-- Line: {finding.line_number or 'N/A'}
-- Message: {finding.message}
-- Rule ID: {finding.rule_id or 'N/A'}
-"""
+    def _build_batch_ai_prompt(self, items: List[Tuple[Finding, List[Finding]]]) -> str:
+        """
+        Build prompt for AI root cause analysis of several findings at once.
+
+        Args:
+            items: (finding, correlated findings) pairs
+
+        Returns:
+            Prompt string
+        """
+        parts = [
+            f"Analyze these {len(items)} code quality findings to identify the root cause of each.\n"
+        ]
+        for number, (finding, correlated_findings) in enumerate(items, 1):
+            parts.append(f"\n### Finding {number}\n\n")
+            parts.append(self._build_finding_details(finding, correlated_findings))
+
+        parts.append(_AI_BATCH_TASK)
+        return "".join(parts)
+
+    def _build_finding_details(
+        self, finding: Finding, correlated_findings: Optional[List[Finding]] = None
+    ) -> str:
+        """
+        Describe a finding and its correlated findings for an AI prompt.
+
+        Args:
+            finding: Finding to describe
+            correlated_findings: Correlated findings
+
+        Returns:
+            Prompt section string
+        """
+        parts = [
+            _AI_FINDING_DETAILS.format(
+                category=finding.category,
+                severity=finding.severity,
+                file_path=finding.file_path,
+                line=finding.line_number or "N/A",
+                message=finding.message,
+                rule_id=finding.rule_id or "N/A",
+            )
+        ]
 
         if finding.code_snippet:
-            prompt += f"\n**Code Snippet:**\n```\n{finding.code_snippet}\n```\n"
+            parts.append(f"\n**Code Snippet:**\n```\n{finding.code_snippet}\n```\n")
 
         if correlated_findings:
-            prompt += f"\n**Correlated Findings ({len(correlated_findings)}):**\n"
+            parts.append(f"\n**Correlated Findings ({len(correlated_findings)}):**\n")
             for cf in correlated_findings[:3]:  # Limit to 3 for brevity
-                prompt += f"- {cf.category}: {cf.message} ({cf.file_path})\n"
+                parts.append(f"- {cf.category}: {cf.message} ({cf.file_path})\n")
 
-        prompt += """
-**Task:**
-Identify the root cause of this issue. Consider:
-1. Is this a symptom of a deeper problem?
-2. What underlying issue caused this?
-3. Are there related patterns in the codebase?
+        return "".join(parts)
 
-Respond in this format:
-ROOT_CAUSE: [One sentence describing the root cause]
-CONTRIBUTING_FACTORS: [Comma-separated list of contributing factors]
-EVIDENCE: [Key evidence supporting this root cause]
-CONFIDENCE: [0.0-1.0 confidence score]
-RELATED_PATTERNS: [Common patterns that might exist elsewhere]
-"""
+    def _parse_batch_ai_response(
+        self, response: str, findings: List[Finding]
+    ) -> List[Optional[RootCauseInfo]]:
+        """
+        Parse a batched AI response into one RootCauseInfo per finding.
 
-        return prompt
+        Args:
+            response: AI response text
+            findings: Findings in the order they were numbered in the prompt
+
+        Returns:
+            RootCauseInfo for each finding, None where its block is missing
+            or malformed
+        """
+        results: List[Optional[RootCauseInfo]] = [None] * len(findings)
+
+        # re.split with a capture group yields [preamble, n1, block1, n2, block2, ...],
+        # where n is None for the text after a "---" separator
+        pieces = _AI_BATCH_SPLIT_RE.split(response)
+        for number, block in zip(pieces[1::2], pieces[2::2]):
+            if number is None:
+                continue
+            index = int(number) - 1
+            if 0 <= index < len(findings) and results[index] is None:
+                results[index] = self._parse_ai_response(block, findings[index])
+
+        return results
 
     def _parse_ai_response(self, response: str, finding: Finding) -> Optional[RootCauseInfo]:
         """
@@ -218,14 +624,14 @@ RELATED_PATTERNS: [Common patterns that might exist elsewhere]
             RootCauseInfo if parsing successful, None otherwise
         """
         try:
-            lines = response.strip().split("\n")
-            data = {}
-
-            for line in lines:
-                if ":" in line:
-                    key, value = line.split(":", 1)
-                    key = key.strip().lower().replace(" ", "_")
-                    data[key] = value.strip()
+            data: Dict[str, str] = {}
+            for key, value in _AI_FIELD_RE.findall(response):
+                key = key.strip().lower().replace(" ", "_")
+                if key in data and key in _AI_FIELDS:
+                    # A repeated field means blocks ran together, so neither
+                    # value can be trusted to belong to this finding
+                    return None
+                data[key] = value.strip()
 
             # Extract fields
             primary_cause = data.get("root_cause", "Unknown root cause")
@@ -240,11 +646,9 @@ RELATED_PATTERNS: [Common patterns that might exist elsewhere]
                 p.strip() for p in data.get("related_patterns", "").split(",") if p.strip()
             ]
 
-            # Parse confidence
-            try:
-                confidence = float(confidence_str)
-            except ValueError:
-                confidence = 0.5
+            # Parse confidence, ignoring any trailing commentary
+            match = _AI_CONFIDENCE_RE.search(confidence_str)
+            confidence = float(match.group()) if match else 0.5
 
             return RootCauseInfo(
                 primary_cause=primary_cause,
@@ -257,31 +661,38 @@ RELATED_PATTERNS: [Common patterns that might exist elsewhere]
         except Exception:
             return None
 
-    def _analyze_with_heuristics(
+    def _match_root_cause_pattern(
         self, finding: Finding, correlated_findings: Optional[List[Finding]] = None
     ) -> Optional[RootCauseInfo]:
         """
-        Use heuristic rules to identify root cause.
+        Identify a root cause from the keywords in a finding's message.
 
         Args:
             finding: Finding to analyze
             correlated_findings: Correlated findings
 
         Returns:
-            RootCauseInfo based on heuristics
+            RootCauseInfo for the matched pattern, None if no keyword matched
         """
-        message_lower = finding.message.lower()
-
-        # Check each root cause pattern
-        for root_cause, keywords in self.ROOT_CAUSE_PATTERNS.items():
-            if any(keyword in message_lower for keyword in keywords):
-                # Found a match
-                return self._build_heuristic_root_cause(
-                    root_cause, finding, correlated_findings
-                )
+        message_lower = finding.message_lower
+
+        # The earliest root cause in pattern order wins, wherever in the
+        # message its keyword appears. Every alternative is a capture group,
+        # so lastindex is always set on a match.
+        matched = min(
+            (
+                match.lastindex
+                for match in self._root_cause_re.finditer(message_lower)
+                if match.lastindex is not None
+            ),
+            default=None,
+        )
+        if matched is not None:
+            return self._build_heuristic_root_cause(
+                self._root_causes[matched - 1], finding, correlated_findings
+            )
 
-        # No specific pattern matched, create generic root cause
-        return self._build_generic_root_cause(finding, correlated_findings)
+        return None
 
     def _build_heuristic_root_cause(
         self,
@@ -300,26 +711,15 @@ RELATED_PATTERNS: [Common patterns that might exist elsewhere]
         Returns:
             RootCauseInfo
         """
-        # Map root cause types to descriptions
-        descriptions = {
-            "lack_of_input_validation": "Insufficient input validation and sanitization",
-            "insufficient_error_handling": "Inadequate error handling and exception management",
-            "insecure_configuration": "Insecure configuration or hardcoded credentials",
-            "poor_code_organization": "Poor code organization and high complexity",
-            "missing_tests": "Insufficient test coverage",
-            "dependency_issues": "Vulnerable or outdated dependencies",
-            "race_condition": "Potential race condition or concurrency issue",
-            "memory_management": "Memory management or resource leak issue",
-        }
-
-        primary_cause = descriptions.get(
-            root_cause_type, f"Issue related to {root_cause_type.replace('_', ' ')}"
+        primary_cause = (
+            self._ROOT_CAUSE_DESCRIPTIONS.get(root_cause_type)
+            or f"Issue related to {root_cause_type.replace('_', ' ')}"
         )
 
         # Build contributing factors
         contributing_factors = [f"{finding.category} category issue"]
 
-        if finding.severity.value in ["critical", "high"]:
+        if finding.severity in _HIGH_SEVERITIES:
             contributing_factors.append("High severity indicates systemic problem")
 
         if correlated_findings and len(correlated_findings) > 2:
@@ -345,8 +745,7 @@ RELATED_PATTERNS: [Common patterns that might exist elsewhere]
         ]
 
         if finding.file_path:
-            directory = os.path.dirname(finding.file_path)
-            related_patterns.append(f"Check other files in {directory}")
+            related_patterns.append(f"Check other files in {finding.directory}")
 
         return RootCauseInfo(
             primary_cause=primary_cause,
@@ -409,17 +808,192 @@ RELATED_PATTERNS: [Common patterns that might exist elsewhere]
         Returns:
             Dict mapping finding IDs to root cause info
         """
+        if not self._client:
+            # No AI requests to overlap, so skip the event loop entirely
+            finding_map = {f.id: f for f in findings}
+            return {
+                finding.id: self.analyze(
+                    finding, self._correlated_findings(finding, finding_map, correlations)
+                )
+                for finding in findings
+            }
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run_coroutine(self.analyze_batch_async(findings, correlations))
+
+        # asyncio.run() can't nest inside a running loop, so drive the
+        # batch from a worker thread with its own loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
+                run_coroutine, self.analyze_batch_async(findings, correlations)
+            ).result()
+
+    async def analyze_batch_async(
+        self, findings: List[Finding], correlations: dict[str, List[str]]
+    ) -> dict[str, Optional[RootCauseInfo]]:
+        """
+        Analyze multiple findings for root causes, issuing AI requests concurrently.
+
+        Findings sharing a category and rule ID are packed up to
+        ``config.ai_batch_size`` per AI request, and at most
+        ``config.max_concurrent_ai_requests`` requests are in flight at once,
+        so a batch costs a few round-trips rather than one per finding.
+
+        Args:
+            findings: List of findings to analyze
+            correlations: Map of finding IDs to correlated finding IDs
+
+        Returns:
+            Dict mapping finding IDs to root cause info
+        """
+        if not self.config.enabled:
+            return {finding.id: None for finding in findings}
+
         # Create finding lookup
         finding_map = {f.id: f for f in findings}
+        corr_findings = [
+            self._correlated_findings(finding, finding_map, correlations) for finding in findings
+        ]
+
+        # Only findings without a confident keyword match go to the AI
+        root_causes = [
+            self._match_root_cause_pattern(finding, corr)
+            for finding, corr in zip(findings, corr_findings)
+        ]
+        unresolved = [
+            index
+            for index, root_cause in enumerate(root_causes)
+            if not self._is_confident(root_cause)
+        ]
+
+        if unresolved and self.config.use_ai and self._client:
+            async with async_anthropic_client(self._api_key):
+                ai_root_causes = await self._analyze_with_ai_batch_async(
+                    [findings[index] for index in unresolved],
+                    [corr_findings[index] for index in unresolved],
+                )
+            for index, ai_root_cause in zip(unresolved, ai_root_causes):
+                if self._is_confident(ai_root_cause):
+                    root_causes[index] = ai_root_cause
+
+        # Fallback to a generic root cause where nothing matched
+        return {
+            finding.id: root_cause or self._build_generic_root_cause(finding, corr)
+            for finding, corr, root_cause in zip(findings, corr_findings, root_causes)
+        }
+
+    async def _analyze_with_ai_batch_async(
+        self, findings: List[Finding], corr_findings: List[List[Finding]]
+    ) -> List[Optional[RootCauseInfo]]:
+        """
+        Use AI to analyze many findings with as few requests as possible.
+
+        Cached findings skip the network, findings with the same cache key
+        share one analysis, and the rest are packed into requests by
+        category and rule ID.
+
+        Args:
+            findings: Findings to analyze
+            corr_findings: Correlated findings for each finding
+
+        Returns:
+            RootCauseInfo (or None) for each finding, in input order
+        """
+        results: List[Optional[RootCauseInfo]] = [None] * len(findings)
+
+        # Cache key -> indices of the findings awaiting it
+        pending: Dict[Tuple[Any, ...], List[int]] = {}
+        for index, finding in enumerate(findings):
+            cache_key = self._get_cache_key(finding)
+            if cache_key in pending:
+                pending[cache_key].append(index)
+                continue
+            cached = self._check_cache(cache_key)
+            if cached:
+                results[index] = cached
+            else:
+                pending[cache_key] = [index]
+
+        groups: Dict[Tuple[str, Optional[str]], List[Tuple[Any, ...]]] = defaultdict(list)
+        for cache_key in pending:
+            # Cache keys start with (category, rule_id)
+            groups[cache_key[:2]].append(cache_key)
+
+        batch_size = self.config.ai_batch_size
+        chunks = [
+            keys[start : start + batch_size]
+            for keys in groups.values()
+            for start in range(0, len(keys), batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_ai_requests)
 
-        results = {}
-        for finding in findings:
-            # Get correlated findings
-            corr_ids = correlations.get(finding.id, [])
-            corr_findings = [finding_map[cid] for cid in corr_ids if cid in finding_map]
+        async def limited(chunk: List[Tuple[Any, ...]]) -> List[Optional[RootCauseInfo]]:
+            items = [(findings[pending[key][0]], corr_findings[pending[key][0]]) for key in chunk]
+            async with semaphore:
+                return await self._request_ai_root_causes(items)
 
-            # Analyze
-            root_cause = self.analyze(finding, corr_findings)
-            results[finding.id] = root_cause
+        chunk_results = await asyncio.gather(*(limited(chunk) for chunk in chunks))
+        for chunk, root_causes in zip(chunks, chunk_results):
+            for cache_key, root_cause in zip(chunk, root_causes):
+                self._set_cache(cache_key, root_cause)
+                for index in pending[cache_key]:
+                    results[index] = root_cause
 
         return results
+
+    async def _request_ai_root_causes(
+        self, items: List[Tuple[Finding, List[Finding]]]
+    ) -> List[Optional[RootCauseInfo]]:
+        """
+        Send one AI request covering one or more findings.
+
+        Args:
+            items: (finding, correlated findings) pairs
+
+        Returns:
+            RootCauseInfo (or None) for each pair, in order
+        """
+        if len(items) == 1:
+            return [await self._analyze_with_ai_async(*items[0])]
+
+        try:
+            text = ""
+            async with self._get_async_client().messages.stream(
+                model="claude-sonnet-4-5",
+                max_tokens=1024 * len(items),
+                messages=[{"role": "user", "content": self._build_batch_ai_prompt(items)}],
+            ) as stream:
+                async for chunk in stream.text_stream:
+                    text += chunk
+                    if self._is_ai_response_complete(text, len(items)):
+                        break
+            return self._parse_batch_ai_response(text, [finding for finding, _ in items])
+
+        except Exception:
+            # Fall back to heuristics on error
+            return [None] * len(items)
+
+    def _correlated_findings(
+        self,
+        finding: Finding,
+        finding_map: Dict[str, Finding],
+        correlations: dict[str, List[str]],
+    ) -> List[Finding]:
+        """
+        Look up the findings correlated with a finding.
+
+        Args:
+            finding: Finding whose correlations to resolve
+            finding_map: Map of finding IDs to findings in the batch
+            correlations: Map of finding IDs to correlated finding IDs
+
+        Returns:
+            Correlated findings present in the batch
+        """
+        corr_ids = correlations.get(finding.id, ())
+        # One dict lookup per ID instead of a membership test plus an index
+        return [
+            corr_finding for cid in corr_ids if (corr_finding := finding_map.get(cid)) is not None
+        ]
@@ -4,11 +4,14 @@ Type definitions for the Harmonization Engine.
 This module defines all Pydantic models used throughout the harmonization process.
 """
 
+import os
+import sys
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from omniaudit.models.ai_models import Severity
 
@@ -52,6 +55,10 @@ class FixStrategy(str, Enum):
 # ============================================================================
 
 
+# Finding fields -> cached properties computed from them
+_FINDING_DERIVED_PROPERTIES = {"message": "message_lower", "file_path": "directory"}
+
+
 class Finding(BaseModel):
     """Represents a single finding from an analyzer."""
 
@@ -68,6 +75,29 @@ class Finding(BaseModel):
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
     timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
 
+    @field_validator("analyzer_name", "category", "rule_id")
+    @classmethod
+    def intern_labels(cls, v: Optional[str]) -> Optional[str]:
+        """Intern low-cardinality labels so equal values share one string object."""
+        return sys.intern(v) if v is not None else v
+
+    @cached_property
+    def message_lower(self) -> str:
+        """Lowercased message, computed once and shared by every stage."""
+        return self.message.lower()
+
+    @cached_property
+    def directory(self) -> str:
+        """Directory part of file_path, computed once and shared by every stage."""
+        return os.path.dirname(self.file_path)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        derived = _FINDING_DERIVED_PROPERTIES.get(name)
+        if derived:
+            # Drop the cached value so it follows the new field value
+            self.__dict__.pop(derived, None)
+
 
 class AutoFix(BaseModel):
     """Represents an automatically generated fix."""
@@ -88,6 +118,10 @@ class AutoFix(BaseModel):
 class RootCauseInfo(BaseModel):
     """Root cause information for a finding."""
 
+    # Frozen so one analysis can be shared by every finding with the same
+    # cause (and by the AI cache) without defensive copies
+    model_config = ConfigDict(frozen=True)
+
     primary_cause: str = Field(description="Primary root cause")
     contributing_factors: List[str] = Field(default_factory=list, description="Contributing factors")
     evidence: List[str] = Field(default_factory=list, description="Evidence supporting root cause")
@@ -98,12 +132,17 @@ class RootCauseInfo(BaseModel):
 class HarmonizedFinding(BaseModel):
     """A harmonized finding that may combine multiple raw findings."""
 
+    # Harmonized findings are final once built; freezing them lets results be
+    # shared and summarized without defensive copies
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique ID for harmonized finding")
     original_finding_ids: List[str] = Field(description="IDs of original findings that were merged")
     file_path: str = Field(description="Primary file path")
     affected_files: List[str] = Field(default_factory=list, description="All affected files")
     line_number: Optional[int] = Field(None, description="Primary line number", ge=1)
     severity: Severity = Field(description="Harmonized severity")
+    rule_id: Optional[str] = Field(None, description="Rule or pattern ID")
     category: str = Field(description="Finding category")
     message: str = Field(description="Harmonized message")
 
@@ -150,6 +189,7 @@ class DeduplicationConfig(BaseModel):
     use_semantic: bool = Field(default=True, description="Use semantic similarity (vs exact matching)")
     consider_location: bool = Field(default=True, description="Consider file location in similarity")
     max_distance_lines: int = Field(default=10, description="Max line distance to consider duplicates", ge=0)
+    cache_max_size: int = Field(default=50_000, description="Max similarity scores kept in the LRU cache", ge=1)
 
 
 class CorrelationConfig(BaseModel):
@@ -159,6 +199,7 @@ class CorrelationConfig(BaseModel):
     file_proximity_threshold: int = Field(default=3, description="Max directory depth for file proximity", ge=0)
     rule_similarity_threshold: float = Field(default=0.7, description="Threshold for rule similarity", ge=0.0, le=1.0)
     max_correlated_findings: int = Field(default=10, description="Max findings to correlate together", ge=1)
+    max_workers: int = Field(default=1, description="Worker processes for correlating large batches (1 = serial)", ge=1)
 
 
 class FalsePositiveConfig(BaseModel):
@@ -187,6 +228,11 @@ class RootCauseConfig(BaseModel):
     use_ai: bool = Field(default=True, description="Use AI for root cause analysis")
     max_depth: int = Field(default=3, description="Max depth for cause chain analysis", ge=1)
     min_confidence: float = Field(default=0.5, description="Min confidence for root cause", ge=0.0, le=1.0)
+    max_concurrent_ai_requests: int = Field(default=8, description="Max AI root cause requests in flight at once", ge=1)
+    ai_batch_size: int = Field(default=8, description="Max findings packed into one AI root cause request", ge=1)
+    ai_cache_max_size: int = Field(default=1024, description="Max AI root causes kept in the LRU cache", ge=1)
+    semantic_cache_enabled: bool = Field(default=False, description="Reuse cached AI root causes for similarly worded findings")
+    semantic_cache_threshold: float = Field(default=0.8, description="Min message similarity for a semantic cache hit", ge=0.0, le=1.0)
 
 
 class FixGenerationConfig(BaseModel):
@@ -197,6 +243,7 @@ class FixGenerationConfig(BaseModel):
     max_fixes_per_finding: int = Field(default=3, description="Max fixes to generate per finding", ge=1)
     min_confidence: float = Field(default=0.6, description="Min confidence to suggest fix", ge=0.0, le=1.0)
     auto_apply_threshold: float = Field(default=0.95, description="Confidence threshold for auto-apply", ge=0.0, le=1.0)
+    max_concurrent_ai_requests: int = Field(default=8, description="Max AI fix requests in flight during batch generation", ge=1)
 
 
 class HarmonizationConfig(BaseModel):
@@ -5,15 +5,67 @@ Provides 15+ tools and resource providers for code auditing.
 """
 
 import asyncio
+import importlib
+import io
 import json
 import logging
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
+import os
+import select
+import stat
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+
+from .resources.providers import MCPResource, ResourceProvider
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson's C parser and encoder for the stdio transport
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object as JSON bytes with the standard library"""
+    return json.dumps(obj).encode()
+
+
+_loads: Callable[[bytes], Any]
+_dumps: Callable[[Any], bytes]
+if ORJSON_AVAILABLE:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+    _dumps = _json_dumps
+
+# Bytes requested from stdin per read; every complete request line a read
+# returns is handled as one batch
+_STDIN_READ_SIZE = 64 * 1024
+
+# Most buffers one os.writev() call accepts
+try:
+    _IOV_MAX = max(os.sysconf("SC_IOV_MAX"), 16)
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 16
+
+ToolExecutor = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+# Tool name -> (module under .tools, executor function); modules are
+# imported on the first call to one of their tools
+_TOOL_EXECUTORS: Dict[str, Tuple[str, str]] = {
+    "omniaudit_audit_run": ("audit", "execute_audit"),
+    "omniaudit_findings_list": ("findings", "execute_list_findings"),
+    "omniaudit_findings_get": ("findings", "execute_get_finding"),
+    "omniaudit_fix_apply": ("fixes", "execute_apply_fix"),
+    "omniaudit_report_generate": ("reports", "execute_generate_report"),
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MCPTool:
     """Represents an MCP tool"""
     name: str
@@ -21,15 +73,6 @@ class MCPTool:
     input_schema: Dict[str, Any]
 
 
-@dataclass
-class MCPResource:
-    """Represents an MCP resource"""
-    uri: str
-    name: str
-    description: str
-    mime_type: str
-
-
 class MCPServer:
     """
     OmniAudit MCP Server
@@ -42,6 +85,14 @@ class MCPServer:
         self.config = config or {}
         self.tools: Dict[str, MCPTool] = {}
         self.resources: Dict[str, MCPResource] = {}
+        # Serialized tools/list and resources/list payloads (and their encoded
+        # responses, by method), built on first request and reset whenever a
+        # tool or resource is registered
+        self._tools_listing: Optional[List[Dict[str, Any]]] = None
+        self._resources_listing: Optional[List[Dict[str, Any]]] = None
+        self._encoded_listings: Dict[str, bytes] = {}
+        # Executors resolved from _TOOL_EXECUTORS so far
+        self._executors: Dict[str, ToolExecutor] = {}
         self._initialize_tools()
         self._initialize_resources()
         logger.info("MCP Server initialized with %d tools and %d resources",
@@ -196,16 +247,14 @@ class MCPServer:
                 input_schema=tool_def["input_schema"]
             )
             self.tools[tool.name] = tool
+        self._reset_listings()
 
     def _initialize_resources(self):
         """Initialize resource providers"""
-        from .resources.providers import ResourceProvider
-
-        provider = ResourceProvider()
-
-        # Register resources
-        for resource in provider.get_resources():
-            self.resources[resource.uri] = resource
+        self.resources = {
+            resource.uri: resource for resource in ResourceProvider().get_resources()
+        }
+        self._reset_listings()
 
     def register_tool(self, tool: Any):
         """Register a tool with the server"""
@@ -216,15 +265,41 @@ class MCPServer:
                 input_schema=tool.input_schema
             )
             self.tools[tool.name] = mcp_tool
+            self._reset_listings()
             logger.debug("Registered tool: %s", tool.name)
 
+    def _reset_listings(self):
+        """Drop cached listings after the registered tools or resources change"""
+        self._tools_listing = None
+        self._resources_listing = None
+        self._encoded_listings.clear()
+
     def list_tools(self) -> List[Dict[str, Any]]:
         """List all available tools"""
-        return [asdict(tool) for tool in self.tools.values()]
+        if self._tools_listing is None:
+            self._tools_listing = [
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "input_schema": tool.input_schema
+                }
+                for tool in self.tools.values()
+            ]
+        return self._tools_listing
 
     def list_resources(self) -> List[Dict[str, Any]]:
         """List all available resources"""
-        return [asdict(resource) for resource in self.resources.values()]
+        if self._resources_listing is None:
+            self._resources_listing = [
+                {
+                    "uri": resource.uri,
+                    "name": resource.name,
+                    "description": resource.description,
+                    "mime_type": resource.mime_type
+                }
+                for resource in self.resources.values()
+            ]
+        return self._resources_listing
 
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -240,23 +315,8 @@ class MCPServer:
         if name not in self.tools:
             raise ValueError(f"Tool not found: {name}")
 
-        # Import and execute the appropriate tool
-        if name == "omniaudit_audit_run":
-            from .tools.audit import execute_audit
-            return await execute_audit(arguments)
-        elif name == "omniaudit_findings_list":
-            from .tools.findings import execute_list_findings
-            return await execute_list_findings(arguments)
-        elif name == "omniaudit_findings_get":
-            from .tools.findings import execute_get_finding
-            return await execute_get_finding(arguments)
-        elif name == "omniaudit_fix_apply":
-            from .tools.fixes import execute_apply_fix
-            return await execute_apply_fix(arguments)
-        elif name == "omniaudit_report_generate":
-            from .tools.reports import execute_generate_report
-            return await execute_generate_report(arguments)
-        else:
+        executor = self._get_executor(name)
+        if executor is None:
             # Mock implementation for other tools
             return {
                 "success": True,
@@ -264,6 +324,25 @@ class MCPServer:
                 "data": {}
             }
 
+        return await executor(arguments)
+
+    def _get_executor(self, name: str) -> Optional[ToolExecutor]:
+        """
+        Get the executor for a tool, importing its module on first use
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Tool executor, or None if the tool has no dedicated executor
+        """
+        executor = self._executors.get(name)
+        if executor is None and name in _TOOL_EXECUTORS:
+            module_name, function_name = _TOOL_EXECUTORS[name]
+            module = importlib.import_module(f".tools.{module_name}", __package__)
+            executor = self._executors[name] = getattr(module, function_name)
+        return executor
+
     async def get_resource(self, uri: str) -> Dict[str, Any]:
         """
         Get a resource by URI
@@ -324,6 +403,29 @@ class MCPServer:
                 }
             }
 
+    async def handle_request_encoded(self, request: Dict[str, Any]) -> bytes:
+        """
+        Handle an MCP protocol request and return the JSON-encoded response
+
+        Listing responses only change when tools or resources are registered,
+        so their encoded form is cached instead of re-serialized per request.
+
+        Args:
+            request: MCP request
+
+        Returns:
+            Encoded MCP response
+        """
+        method = request.get("method")
+        if method in ("tools/list", "resources/list"):
+            encoded = self._encoded_listings.get(method)
+            if encoded is None:
+                encoded = _dumps(await self.handle_request(request))
+                self._encoded_listings[method] = encoded
+            return encoded
+
+        return _dumps(await self.handle_request(request))
+
     async def start(self, host: str = "localhost", port: int = 8001):
         """
         Start the MCP server
@@ -354,6 +456,119 @@ def create_server(config: Optional[Dict[str, Any]] = None) -> MCPServer:
     return MCPServer(config)
 
 
+def _is_pipe(stream: BinaryIO) -> bool:
+    """
+    Check whether a stream is a pipe, socket or terminal
+
+    Args:
+        stream: Binary stream
+
+    Returns:
+        True if the event loop can watch the stream for reads
+    """
+    try:
+        mode = os.fstat(stream.fileno()).st_mode
+    except (OSError, ValueError):
+        return False
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or stat.S_ISCHR(mode)
+
+
+async def _read_request_batches(stdin: BinaryIO) -> AsyncIterator[List[bytes]]:
+    """
+    Read newline-delimited requests from stdin in batches
+
+    Each read drains whatever the client has already written, so a burst of
+    requests costs one read instead of one per line.
+
+    Args:
+        stdin: Binary stdin stream
+
+    Yields:
+        The complete request lines returned by one read
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    # Regular files, in-memory streams (and stdin on some platforms) can't be
+    # watched by the event loop, so read them with blocking calls instead.
+    # read1() returns what is available rather than waiting for a full chunk.
+    watched = _is_pipe(stdin)
+    if watched:
+        try:
+            await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), stdin)
+        except (ValueError, NotImplementedError, OSError):
+            watched = False
+    read = stdin.read1 if isinstance(stdin, io.BufferedIOBase) else stdin.read
+
+    partial: List[bytes] = []
+    while True:
+        if watched:
+            chunk = await reader.read(_STDIN_READ_SIZE)
+        else:
+            chunk = read(_STDIN_READ_SIZE)
+        if not chunk:
+            break
+
+        lines = chunk.split(b"\n")
+        if len(lines) == 1:
+            partial.append(chunk)
+            continue
+
+        # Complete the line left over from earlier reads; the text after the
+        # last newline starts the next one
+        partial.append(lines[0])
+        lines[0] = b"".join(partial)
+        partial = [lines.pop()]
+        yield lines
+
+    # A final request without a trailing newline is still handled
+    tail = b"".join(partial)
+    if tail:
+        yield [tail]
+
+
+def _write_buffers(stdout: BinaryIO, buffers: List[bytes]) -> None:
+    """
+    Write buffers to stdout in order, scattering them with os.writev()
+
+    Falls back to one joined write where writev() or a file descriptor is
+    unavailable (Windows, or a replaced stdout).
+
+    Args:
+        stdout: Binary stdout stream
+        buffers: Byte strings to write
+    """
+    try:
+        fd = stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        fd = None
+
+    if fd is None or not hasattr(os, "writev"):
+        stdout.write(b"".join(buffers))
+        stdout.flush()
+        return
+
+    # Anything already buffered by the stream has to go out first
+    stdout.flush()
+
+    pending: List[Any] = list(buffers)
+    start = 0
+    while start < len(pending):
+        try:
+            written = os.writev(fd, pending[start:start + _IOV_MAX])
+        except BlockingIOError:
+            # Watching stdin makes it non-blocking, and so stdout too when
+            # both are the same terminal; wait until it can take more
+            select.select([], [fd], [])
+            continue
+
+        # Skip the buffers written in full and trim a partially written one
+        while start < len(pending) and written >= len(pending[start]):
+            written -= len(pending[start])
+            start += 1
+        if written:
+            pending[start] = memoryview(pending[start])[written:]
+
+
 async def main():
     """Main entry point for the MCP server"""
     import sys
@@ -368,21 +583,35 @@ async def main():
     # Handle stdio-based MCP protocol
     logger.info("MCP Server ready (stdio mode)")
 
+    stdout = sys.stdout.buffer
+
     try:
-        while True:
-            line = sys.stdin.readline()
-            if not line:
-                break
-
-            try:
-                request = json.loads(line)
-                response = await server.handle_request(request)
-                print(json.dumps(response))
-                sys.stdout.flush()
-            except json.JSONDecodeError:
-                logger.error("Invalid JSON received")
-            except Exception as e:
-                logger.error("Error processing request: %s", str(e))
+        async for lines in _read_request_batches(sys.stdin.buffer):
+            requests = []
+            for line in lines:
+                try:
+                    requests.append(_loads(line))
+                except json.JSONDecodeError:
+                    logger.error("Invalid JSON received")
+
+            # Requests in a batch are independent, so handle them concurrently
+            results = await asyncio.gather(
+                *(server.handle_request_encoded(request) for request in requests),
+                return_exceptions=True
+            )
+
+            # Encoded responses are written as-is, with their newline
+            # separators interleaved, so they are never copied
+            output: List[bytes] = []
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error("Error processing request: %s", str(result))
+                else:
+                    output += (result, b"\n")
+
+            # One scattered write for the whole batch
+            if output:
+                _write_buffers(stdout, output)
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     finally:
@@ -1,5 +1,6 @@
 """Audit tools for MCP server"""
 
+from hashlib import blake2b
 from typing import Any, Dict
 import logging
 
@@ -63,7 +64,8 @@ async def execute_audit(arguments: Dict[str, Any]) -> Dict[str, Any]:
     # Mock audit result
     result = {
         "success": True,
-        "audit_id": f"audit-{hash(path)}",
+        # Stable across runs (unlike hash()), so audits of a path can be compared
+        "audit_id": f"audit-{blake2b(path.encode(), digest_size=8).hexdigest()}",
         "project": path,
         "total_files": 127,
         "total_findings": 23,
@@ -1,11 +1,20 @@
 """Findings management tools for MCP server"""
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, List
+import fnmatch
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _compile_file_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a file glob once; clients tend to repeat the same filters"""
+    return re.compile(fnmatch.translate(pattern))
+
+
 class FindingsTool:
     """Tool for managing audit findings"""
 
@@ -60,7 +69,7 @@ async def execute_list_findings(arguments: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("Listing findings with filters: severity=%s, category=%s", severity, category)
 
     # Mock findings
-    findings = [
+    findings: List[Dict[str, Any]] = [
         {
             "id": "1",
             "rule_id": "security/no-eval",
@@ -86,6 +95,10 @@ async def execute_list_findings(arguments: Dict[str, Any]) -> Dict[str, Any]:
     ]
 
     # Apply filters (mock)
+    if file_pattern:
+        file_re = _compile_file_pattern(file_pattern)
+        findings = [finding for finding in findings if file_re.match(finding["file"])]
+
     filtered = findings[:limit]
 
     return {
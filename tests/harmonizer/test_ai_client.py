@@ -0,0 +1,65 @@
+"""Tests for the shared Anthropic clients."""
+
+import pytest
+from omniaudit.harmonizer import ai_client
+from omniaudit.harmonizer.ai_client import async_anthropic_client, get_async_anthropic_client
+
+
+class FakeAsyncAnthropic:
+    """Async client stand-in that records when it is closed."""
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_sdk(monkeypatch):
+    """Replace the SDK's async client with FakeAsyncAnthropic."""
+    monkeypatch.setattr(ai_client, "ANTHROPIC_AVAILABLE", True)
+    monkeypatch.setattr(ai_client, "AsyncAnthropic", FakeAsyncAnthropic, raising=False)
+
+
+class TestAsyncAnthropicClient:
+    """Test async_anthropic_client and get_async_anthropic_client."""
+
+    @pytest.mark.asyncio
+    async def test_client_closed_on_exit(self, fake_sdk):
+        """Test that the block closes the client it opened."""
+        async with async_anthropic_client("key") as client:
+            assert get_async_anthropic_client("key") is client
+            assert not client.closed
+
+        assert client.closed
+        with pytest.raises(RuntimeError):
+            get_async_anthropic_client("key")
+
+    @pytest.mark.asyncio
+    async def test_nested_block_reuses_client(self, fake_sdk):
+        """Test that nested blocks for the same key share one client."""
+        async with async_anthropic_client("key") as outer:
+            async with async_anthropic_client("key") as inner:
+                assert inner is outer
+            assert not outer.closed
+
+            async with async_anthropic_client("other") as other:
+                assert other is not outer
+                assert get_async_anthropic_client("other") is other
+            assert other.closed
+            assert get_async_anthropic_client("key") is outer
+
+        assert outer.closed
+
+    @pytest.mark.asyncio
+    async def test_no_client_without_api_key(self, fake_sdk):
+        """Test that no client is opened without an API key."""
+        async with async_anthropic_client(None) as client:
+            assert client is None
+            with pytest.raises(RuntimeError):
+                get_async_anthropic_client(None)
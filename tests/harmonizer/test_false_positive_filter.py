@@ -0,0 +1,56 @@
+"""Tests for FalsePositiveFilter."""
+
+from omniaudit.harmonizer.false_positive_filter import FalsePositiveFilter
+from omniaudit.harmonizer.types import FalsePositiveConfig, Finding, Severity
+
+
+def make_finding(finding_id, file_path="src/app.py", message="Possible SQL injection"):
+    """Build a finding for the filter."""
+    return Finding(
+        id=finding_id,
+        analyzer_name="security",
+        file_path=file_path,
+        severity=Severity.HIGH,
+        category="security",
+        message=message,
+    )
+
+
+class TestFalsePositiveFilter:
+    """Test FalsePositiveFilter class."""
+
+    def test_generated_code_filtered(self):
+        """Test that findings in generated code are false positives."""
+        fp_filter = FalsePositiveFilter(FalsePositiveConfig())
+
+        valid, false_positives = fp_filter.filter(
+            [make_finding("a"), make_finding("b", file_path="web/node_modules/x.js")]
+        )
+
+        assert [f.id for f in valid] == ["a"]
+        assert [f.id for f in false_positives] == ["b"]
+
+    def test_config_changes_apply_to_next_filter(self):
+        """Test that memoized checks follow in-place config changes."""
+        config = FalsePositiveConfig()
+        fp_filter = FalsePositiveFilter(config)
+        finding = make_finding("a", file_path="src/legacy/app.py")
+        assert fp_filter.filter([finding])[1] == []
+
+        config.whitelist_patterns.append("legacy/")
+        assert fp_filter.filter([finding])[1] == [finding]
+        assert fp_filter.analyze_finding(finding)[0]
+
+        config.confidence_threshold = 1.0
+        assert fp_filter.filter([finding])[1] == []
+
+    def test_analyze_finding_follows_finding_content(self):
+        """Test that analyze_finding doesn't reuse analyses of other content."""
+        fp_filter = FalsePositiveFilter(FalsePositiveConfig())
+        finding = make_finding("a", file_path="web/node_modules/x.js")
+        assert fp_filter.filter([finding])[1] == [finding]
+        assert fp_filter.analyze_finding(finding)[0]
+
+        finding.file_path = "src/app.py"
+        assert fp_filter.analyze_finding(finding) == (False, 0.0, [])
+        assert fp_filter.analyze_finding(make_finding("a", file_path="web/dist/x.js"))[0]
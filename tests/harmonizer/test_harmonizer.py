@@ -0,0 +1,92 @@
+"""Tests for Harmonizer."""
+
+import asyncio
+
+import pytest
+from omniaudit.harmonizer import Harmonizer
+from omniaudit.harmonizer.types import Finding, Severity
+
+
+def make_finding(finding_id, **overrides):
+    """Build a finding with sensible defaults."""
+    fields = {
+        "id": finding_id,
+        "analyzer_name": "security",
+        "file_path": f"src/{finding_id}.py",
+        "line_number": 10,
+        "severity": Severity.MEDIUM,
+        "rule_id": "SEC001",
+        "category": "security",
+    }
+    fields.update(overrides)
+    fields.setdefault("message", f"Possible SQL injection in {fields['file_path']}")
+    return Finding(**fields)
+
+
+class TestHarmonizeAsync:
+    """Test Harmonizer.harmonize_async."""
+
+    @pytest.mark.asyncio
+    async def test_root_causes_analyzed_on_running_loop(self, monkeypatch):
+        """Test that root cause analysis shares the caller's event loop."""
+        harmonizer = Harmonizer()
+        analyzer = harmonizer.root_cause_analyzer
+        loops = []
+        analyze_batch_async = analyzer.analyze_batch_async
+
+        async def recording(findings, correlations):
+            loops.append(asyncio.get_running_loop())
+            return await analyze_batch_async(findings, correlations)
+
+        monkeypatch.setattr(analyzer, "analyze_batch_async", recording)
+
+        result = await harmonizer.harmonize_async([make_finding("a"), make_finding("b")])
+
+        assert loops == [asyncio.get_running_loop()]
+        assert not result.errors
+        assert all(f.root_cause for f in result.findings)
+
+
+class TestExportSummary:
+    """Test Harmonizer.export_summary."""
+
+    def test_summary_follows_result(self):
+        """Test that summaries reflect the result they are built from."""
+        harmonizer = Harmonizer()
+        result = harmonizer.harmonize([make_finding("a")])
+
+        summary = harmonizer.export_summary(result)
+        summary["errors"].append("edited")
+        updated = result.model_copy(update={"errors": ["boom"]})
+
+        assert result.errors == []
+        assert harmonizer.export_summary(result)["errors"] == []
+        assert harmonizer.export_summary(updated)["errors"] == ["boom"]
+
+
+class TestHarmonizeIncremental:
+    """Test Harmonizer.harmonize_incremental."""
+
+    def test_only_known_findings_refreshes_result(self):
+        """Test that re-reporting known findings returns a refreshed copy."""
+        harmonizer = Harmonizer()
+        previous = harmonizer.harmonize([make_finding("a"), make_finding("b")])
+
+        result = harmonizer.harmonize_incremental([make_finding("a2", file_path="src/a.py")], previous)
+
+        assert result is not previous
+        assert result.findings == previous.findings
+        assert result.timestamp >= previous.timestamp
+        assert result.stats.total_findings == previous.stats.total_findings
+
+    def test_escalated_finding_replaces_previous(self):
+        """Test that a re-report with a higher severity is not dropped."""
+        harmonizer = Harmonizer()
+        previous = harmonizer.harmonize([make_finding("a")])
+
+        escalated = make_finding("a2", file_path="src/a.py", severity=Severity.CRITICAL)
+        result = harmonizer.harmonize_incremental([escalated], previous)
+
+        assert [f.id for f in result.findings] == ["a2"]
+        assert result.findings[0].severity == Severity.CRITICAL
+        assert result.findings[0].rule_id == "SEC001"
@@ -0,0 +1,235 @@
+"""Tests for RootCauseAnalyzer's AI paths."""
+
+import pytest
+from omniaudit.harmonizer import ai_client, root_cause_analyzer
+from omniaudit.harmonizer.root_cause_analyzer import RootCauseAnalyzer
+from omniaudit.harmonizer.types import Finding, RootCauseConfig, Severity
+
+
+def make_finding(finding_id, **overrides):
+    """Build a finding that matches no root cause keyword."""
+    fields = {
+        "id": finding_id,
+        "analyzer_name": "quality",
+        "file_path": f"src/{finding_id}.py",
+        "line_number": 10,
+        "severity": Severity.MEDIUM,
+        "rule_id": "Q001",
+        "category": "quality",
+        "message": f"Unexpected behaviour in {finding_id} handler module",
+    }
+    fields.update(overrides)
+    return Finding(**fields)
+
+
+def ai_block(cause, confidence="0.9"):
+    """Build one response block in the format the prompts ask for."""
+    return (
+        f"ROOT_CAUSE: {cause}\n"
+        "CONTRIBUTING_FACTORS: factor one, factor two\n"
+        "EVIDENCE: evidence\n"
+        f"CONFIDENCE: {confidence}\n"
+        "RELATED_PATTERNS: pattern\n"
+    )
+
+
+class FakeStream:
+    """Streamed response that yields its text one line at a time."""
+
+    def __init__(self, text):
+        self.chunks = text.splitlines(keepends=True)
+        self.sent = 0
+        self.text_stream = self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield chunk
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class FakeAI:
+    """Async client stand-in that streams canned responses in order."""
+
+    def __init__(self):
+        self.responses = []
+        self.streams = []
+        self.messages = self
+
+    def __call__(self, api_key):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    def stream(self, **request):
+        stream = FakeStream(self.responses.pop(0))
+        self.streams.append(stream)
+        return stream
+
+
+@pytest.fixture
+def fake_ai(monkeypatch):
+    """Route the analyzer's async AI requests to a FakeAI."""
+    fake = FakeAI()
+    monkeypatch.setattr(ai_client, "ANTHROPIC_AVAILABLE", True)
+    monkeypatch.setattr(ai_client, "AsyncAnthropic", fake, raising=False)
+    monkeypatch.setattr(root_cause_analyzer, "ANTHROPIC_AVAILABLE", True)
+    monkeypatch.setattr(root_cause_analyzer, "get_anthropic_client", lambda api_key: object())
+    return fake
+
+
+def make_analyzer(**config):
+    """Build an analyzer with AI enabled."""
+    return RootCauseAnalyzer(RootCauseConfig(**config), anthropic_api_key="key")
+
+
+class TestParseBatchAIResponse:
+    """Test RootCauseAnalyzer._parse_batch_ai_response."""
+
+    def test_decorated_headers(self):
+        """Test that decorated headers still open their own block."""
+        analyzer = RootCauseAnalyzer(RootCauseConfig(use_ai=False))
+        findings = [make_finding(f"f{n}") for n in range(1, 4)]
+        response = (
+            "FINDING 1\n"
+            + ai_block("cause one")
+            + "---\n## Finding 2:\n"
+            + ai_block("cause two")
+            + "---\n**FINDING 3**\n"
+            + ai_block("cause three")
+            + "---\n"
+        )
+
+        results = analyzer._parse_batch_ai_response(response, findings)
+
+        assert [r.primary_cause for r in results] == ["cause one", "cause two", "cause three"]
+
+    def test_separator_ends_block(self):
+        """Test that text after a separator is not merged into the previous block."""
+        analyzer = RootCauseAnalyzer(RootCauseConfig(use_ai=False))
+        findings = [make_finding("f1"), make_finding("f2")]
+        response = (
+            "FINDING 1\n"
+            + ai_block("cause one")
+            + "---\nFinding two: see below\n"
+            + ai_block("cause two")
+        )
+
+        results = analyzer._parse_batch_ai_response(response, findings)
+
+        assert results[0].primary_cause == "cause one"
+        assert results[1] is None
+
+    def test_duplicate_fields_rejected(self):
+        """Test that a block repeating a field is rejected rather than guessed."""
+        analyzer = RootCauseAnalyzer(RootCauseConfig(use_ai=False))
+        findings = [make_finding("f1"), make_finding("f2")]
+        response = "FINDING 1\n" + ai_block("cause one") + ai_block("cause two")
+
+        results = analyzer._parse_batch_ai_response(response, findings)
+
+        assert results == [None, None]
+
+
+class TestAIRequests:
+    """Test streamed AI requests through the batch and single paths."""
+
+    @pytest.mark.asyncio
+    async def test_batch_request(self, fake_ai):
+        """Test that one streamed request covers a batch of findings."""
+        analyzer = make_analyzer()
+        findings = [make_finding(name) for name in ("alpha", "beta", "gamma")]
+        fake_ai.responses.append(
+            "".join(f"FINDING {n}\n{ai_block(f'cause {n}')}---\n" for n in (1, 2, 3))
+        )
+
+        results = await analyzer.analyze_batch_async(findings, {})
+
+        assert len(fake_ai.streams) == 1
+        assert [results[f.id].primary_cause for f in findings] == ["cause 1", "cause 2", "cause 3"]
+
+    @pytest.mark.asyncio
+    async def test_stream_stops_after_last_field(self, fake_ai):
+        """Test that the stream is abandoned once every block is complete."""
+        analyzer = make_analyzer()
+        findings = [make_finding("alpha"), make_finding("beta")]
+        response = "".join(f"FINDING {n}\n{ai_block(f'cause {n}')}" for n in (1, 2))
+        fake_ai.responses.append(response + "Closing remarks\n" * 5)
+
+        results = await analyzer.analyze_batch_async(findings, {})
+
+        stream = fake_ai.streams[0]
+        assert stream.sent == len(response.splitlines())
+        assert results["beta"].primary_cause == "cause 2"
+
+    @pytest.mark.asyncio
+    async def test_single_stream_stops_after_last_field(self, fake_ai):
+        """Test that a single-finding request also stops early."""
+        analyzer = make_analyzer()
+        fake_ai.responses.append(ai_block("cause") + "Closing remarks\n" * 5)
+
+        root_cause = await analyzer.analyze_async(make_finding("f1"))
+
+        assert fake_ai.streams[0].sent == 5
+        assert root_cause.primary_cause == "cause"
+
+
+class TestAICache:
+    """Test the exact and semantic AI root cause caches."""
+
+    @pytest.mark.asyncio
+    async def test_exact_cache(self, fake_ai):
+        """Test that findings differing only in numbers reuse one analysis."""
+        analyzer = make_analyzer()
+        fake_ai.responses.append(ai_block("cause"))
+
+        first = await analyzer.analyze_async(make_finding("f1", message="Timeout after 30 seconds"))
+        second = await analyzer.analyze_async(make_finding("f2", message="Timeout after 60 seconds"))
+
+        assert len(fake_ai.streams) == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache(self, fake_ai):
+        """Test that a similarly worded finding reuses a cached analysis."""
+        analyzer = make_analyzer(semantic_cache_enabled=True, semantic_cache_threshold=0.7)
+        fake_ai.responses.append(ai_block("cause"))
+
+        first = await analyzer.analyze_async(make_finding("request"))
+        second = await analyzer.analyze_async(make_finding("response"))
+
+        assert len(fake_ai.streams) == 1
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_respects_category(self, fake_ai):
+        """Test that similar findings of another category are analyzed afresh."""
+        analyzer = make_analyzer(semantic_cache_enabled=True, semantic_cache_threshold=0.7)
+        fake_ai.responses.extend([ai_block("cause one"), ai_block("cause two")])
+
+        await analyzer.analyze_async(make_finding("request"))
+        root_cause = await analyzer.analyze_async(make_finding("response", category="style"))
+
+        assert len(fake_ai.streams) == 2
+        assert root_cause.primary_cause == "cause two"
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_disabled(self, fake_ai):
+        """Test that similar findings are analyzed separately by default."""
+        analyzer = make_analyzer()
+        fake_ai.responses.extend([ai_block("cause one"), ai_block("cause two")])
+
+        await analyzer.analyze_async(make_finding("request"))
+        root_cause = await analyzer.analyze_async(make_finding("response"))
+
+        assert len(fake_ai.streams) == 2
+        assert root_cause.primary_cause == "cause two"
@@ -0,0 +1,32 @@
+"""Tests for the MCP findings tools."""
+
+import pytest
+from omniaudit.mcp.tools.findings import execute_list_findings
+
+
+class TestListFindings:
+    """Test execute_list_findings."""
+
+    @pytest.mark.asyncio
+    async def test_file_pattern_filter(self):
+        """Test that the file glob selects matching findings only."""
+        result = await execute_list_findings({"file": "src/u*.ts"})
+
+        assert result["total"] == 1
+        assert [f["file"] for f in result["findings"]] == ["src/utils.ts"]
+
+    @pytest.mark.asyncio
+    async def test_file_pattern_matches_whole_path(self):
+        """Test that the glob must match the full path."""
+        result = await execute_list_findings({"file": "utils.ts"})
+
+        assert result["total"] == 0
+        assert result["findings"] == []
+
+    @pytest.mark.asyncio
+    async def test_no_filter_with_limit(self):
+        """Test listing without a filter respects the limit."""
+        result = await execute_list_findings({"limit": 1})
+
+        assert result["total"] == 2
+        assert result["returned"] == 1
@@ -0,0 +1,113 @@
+"""Tests for the MCP server stdio transport."""
+
+import io
+import os
+import threading
+
+import pytest
+from omniaudit.mcp import server
+from omniaudit.mcp.server import _read_request_batches
+
+
+async def read_batches(stdin):
+    """Collect every batch the reader yields."""
+    return [lines async for lines in _read_request_batches(stdin)]
+
+
+class TestReadRequestBatches:
+    """Test _read_request_batches."""
+
+    @pytest.mark.asyncio
+    async def test_lines_split_across_reads(self, monkeypatch):
+        """Test that lines spanning several reads are reassembled."""
+        monkeypatch.setattr(server, "_STDIN_READ_SIZE", 5)
+        stdin = io.BufferedReader(io.BytesIO(b"one\ntwo\nthree\nfour\n"))
+
+        batches = await read_batches(stdin)
+
+        assert batches == [[b"one"], [b"two"], [b"three"], [b"four"]]
+
+    @pytest.mark.asyncio
+    async def test_burst_read_as_one_batch(self):
+        """Test that lines available together are yielded together."""
+        stdin = io.BytesIO(b'{"id": 1}\n{"id": 2}\n{"id": 3}\n')
+
+        assert await read_batches(stdin) == [[b'{"id": 1}', b'{"id": 2}', b'{"id": 3}']]
+
+    @pytest.mark.asyncio
+    async def test_final_line_without_newline(self, monkeypatch):
+        """Test that a last request without a trailing newline is kept."""
+        monkeypatch.setattr(server, "_STDIN_READ_SIZE", 4)
+
+        batches = await read_batches(io.BytesIO(b"first\nsecond"))
+
+        assert batches == [[b"first"], [b"second"]]
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self):
+        """Test that empty input yields no batches."""
+        assert await read_batches(io.BytesIO(b"")) == []
+
+    @pytest.mark.asyncio
+    async def test_pipe_read_by_event_loop(self, monkeypatch):
+        """Test that chunked writes to a pipe are framed into lines."""
+        monkeypatch.setattr(server, "_STDIN_READ_SIZE", 3)
+        read_fd, write_fd = os.pipe()
+
+        def write_chunks():
+            for chunk in (b"al", b"pha\nbe", b"ta\n", b"gamma"):
+                os.write(write_fd, chunk)
+            os.close(write_fd)
+
+        writer = threading.Thread(target=write_chunks)
+        writer.start()
+        with os.fdopen(read_fd, "rb") as stdin:
+            batches = await read_batches(stdin)
+        writer.join()
+
+        assert [line for lines in batches for line in lines] == [b"alpha", b"beta", b"gamma"]
+
+
+class FakeStdout:
+    """Binary stdout stand-in backed by a file descriptor number."""
+
+    def fileno(self):
+        return 99
+
+    def flush(self):
+        pass
+
+
+class TestWriteBuffers:
+    """Test _write_buffers."""
+
+    def test_short_writes_resumed(self, monkeypatch):
+        """Test that partial and refused writes are resumed in order."""
+        monkeypatch.setattr(server, "_IOV_MAX", 2)
+        monkeypatch.setattr(server.select, "select", lambda r, w, x: (r, w, x))
+        written = []
+        calls = []
+
+        def writev(fd, buffers):
+            calls.append(len(buffers))
+            if len(calls) == 2:
+                raise BlockingIOError
+            data = b"".join(bytes(buffer) for buffer in buffers)[:3]
+            written.append(data)
+            return len(data)
+
+        monkeypatch.setattr(server.os, "writev", writev)
+        buffers = [b"alpha", b"\n", b"beta", b"\n"]
+
+        server._write_buffers(FakeStdout(), buffers)
+
+        assert b"".join(written) == b"alpha\nbeta\n"
+        assert max(calls) <= 2
+
+    def test_stream_without_descriptor(self):
+        """Test that streams without a file descriptor get one joined write."""
+        stdout = io.BytesIO()
+
+        server._write_buffers(stdout, [b"one", b"\n", b"two", b"\n"])
+
+        assert stdout.getvalue() == b"one\ntwo\n"